@@ -1,37 +1,64 @@
 #!/usr/bin/env python
 def create_sample_data():
     """Create and upload sample data to MinIO for testing."""
+    import io
+
     import numpy as np
-    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from boto3.s3.transfer import TransferConfig
 
     from minilake.core import MinilakeCore
 
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
+    ids = np.arange(1, 101, dtype=np.int64)
+    salary = rng.normal(50000, 10000, 100)
+    np.round(salary, 2, out=salary)
     data = {
-        "id": range(1, 101),
-        "name": [f"User_{i}" for i in range(1, 101)],
-        "age": np.random.randint(18, 80, 100),
-        "salary": np.random.normal(50000, 10000, 100).round(2),
-        "department": np.random.choice(["HR", "IT", "Sales", "Marketing"], 100),
-        "join_date": pd.date_range(start="2020-01-01", periods=100),
+        "id": ids,
+        "name": np.char.add("User_", ids.astype(str)),
+        "age": rng.integers(18, 80, 100),
+        "salary": salary,
+        "department": rng.choice(np.array(["HR", "IT", "Sales", "Marketing"]), 100),
+        "join_date": np.datetime64("2020-01-01", "ns")
+        + np.arange(100, dtype=np.int64) * np.timedelta64(1, "D"),
     }
 
-    df = pd.DataFrame(data)
+    table = pa.table(data)
 
     core = MinilakeCore()
 
     try:
+        # Prefixes are virtual: the object key alone makes the folder listable
         folder_name = "test-data"
-        core.connection.s3_client.put_object(
-            Bucket=core.connection.bucket, Key=f"{folder_name}/", Body=""
+
+        # Bounded row groups let readers split the file scan across threads
+        buffer = io.BytesIO()
+        pq.write_table(
+            table,
+            buffer,
+            row_group_size=16384,
+            compression="zstd",
+            use_dictionary=True,
+            data_page_size=1 << 20,
         )
+        buffer.seek(0)
 
-        parquet_buffer = df.to_parquet()
-        core.connection.s3_client.put_object(
+        # Files above the threshold are split into parts uploaded in parallel
+        transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True,
+        )
+        core.connection.s3_client.upload_fileobj(
+            buffer,
             Bucket=core.connection.bucket,
             Key=f"{folder_name}/employees.parquet",
-            Body=parquet_buffer,
+            Config=transfer_config,
         )
+        # Listings are cached, so make the new table visible right away
+        core.invalidate(folder_name)
 
         print(f"Successfully created test data in {folder_name}/employees.parquet")
 
@@ -1,8 +1,28 @@
 """MiniLake - A lightweight Delta Lake implementation."""
 
-from minilake.config import Config
-from minilake.storage.delta import DeltaStorage
-from minilake.storage.s3 import S3Manager
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from minilake.config import Config
+    from minilake.storage.delta import DeltaStorage
+    from minilake.storage.s3 import S3Manager
 
 __version__ = "0.1.0"
 __all__ = ["Config", "DeltaStorage", "S3Manager"]
+
+# Heavy dependencies (deltalake, boto3, pyarrow) load on first attribute access
+_LAZY_IMPORTS = {
+    "Config": "minilake.config",
+    "DeltaStorage": "minilake.storage.delta",
+    "S3Manager": "minilake.storage.s3",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
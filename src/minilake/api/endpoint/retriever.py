@@ -2,10 +2,12 @@
 API endpoint for data retrieval communicating with S3.
 """
 
+import asyncio
 import datetime
+from typing import Annotated
 
 import duckdb
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 
 from minilake import S3Manager
 from minilake.config import Config
@@ -27,19 +29,24 @@ if config.use_minio:
 
 
 @app.get("/retrieve")
-def retrieve_data(
+async def retrieve_data(
     delta_path: str,
     table_name: str,
     version: int | None = None,
-    timestamp: str | datetime.datetime | None = None,
+    timestamp: datetime.datetime | None = None,
+    columns: Annotated[list[str] | None, Query()] = None,
 ) -> dict[str, str]:
     """Retrieve data from a Delta table.
 
+    The Delta download and DuckDB load run in a worker thread so the event
+    loop keeps serving other requests meanwhile.
+
     Args:
         delta_path: Path to the Delta table
         table_name: Name of the table to create
         version: Optional version number to retrieve
-        timestamp: Optional timestamp to retrieve data at
+        timestamp: Optional ISO 8601 timestamp to retrieve data at
+        columns: Optional columns to retrieve, all columns when omitted
 
     Returns:
         Dict containing a success message
@@ -50,15 +57,12 @@ def retrieve_data(
             detail="S3 storage is not configured",
         )
 
-    if isinstance(timestamp, str):
-        try:
-            timestamp = datetime.datetime.fromisoformat(timestamp)
-        except ValueError as err:
-            raise HTTPException(
-                status_code=422,
-                detail="Invalid timestamp format. Use ISO format "
-                "(e.g., '2024-01-01T00:00:00')",
-            ) from err
-
-    s3.read_to_duckdb(delta_path, table_name, version=version)
+    await asyncio.to_thread(
+        s3.read_to_duckdb,
+        delta_path,
+        table_name,
+        version=version,
+        timestamp=timestamp,
+        columns=columns,
+    )
     return {"message": "Data retrieved successfully"}
@@ -5,17 +5,29 @@ It includes the necessary parameters for connecting to MinIO and Delta Lake,
 as well as methods to retrieve storage options.
 """
 
+import functools
 import os
 
 from dotenv import load_dotenv
 
 
+@functools.cache
+def load_env() -> None:
+    """Load the .env file into the environment once per process."""
+    load_dotenv()
+
+
 class Config:
     """Configuration for connectors and Delta Lake storage"""
 
     class DatabaseConfig:
-        def __init__(self, path: str = "default.db"):
+        def __init__(
+            self, path: str = "default.db", pool_size: int = 4, read_only: bool = False
+        ):
             self.path = path
+            self.pool_size = pool_size
+            # Read-only processes can share the database file with each other
+            self.read_only = read_only
 
     class StorageConfig:
         def __init__(
@@ -52,7 +64,7 @@ class Config:
         delta_root: str | None = None,
         database: DatabaseConfig | None = None,
     ):
-        load_dotenv()
+        load_env()
 
         self.minio_endpoint = minio_endpoint or os.getenv(
             "MINIO_ENDPOINT", "localhost:9000"
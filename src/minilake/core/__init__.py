@@ -1,14 +1,30 @@
-import io
+import os
+import threading
+import time
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-import pandas as pd
+import pyarrow.parquet as pq
+from pyarrow import fs
 
-from .connection import MinilakeConnection
+from .connection import get_minilake
 from .exceptions import MinilakeConnectionError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+TABLE_CACHE_TTL = 5.0
+TABLE_CACHE_SIZE = 128
+
+# Shared by every MinilakeCore, as the UI builds a new one on each rerun
+_table_cache: dict[tuple[str, str], tuple[float, list[str]]] = {}
+_table_cache_lock = threading.Lock()
+
 
 class MinilakeCore:
-    def __init__(self):
-        self.connection = MinilakeConnection()
+    def __init__(self, table_cache_ttl: float = TABLE_CACHE_TTL):
+        self.connection = get_minilake()
+        self.table_cache_ttl = table_cache_ttl
 
     def list_s3_folders(self) -> list[str]:
         """Get list of available S3 folders."""
@@ -23,29 +39,53 @@ class MinilakeCore:
         Returns:
             List[str]: List of table names in the folder
         """
+        key = (self.connection.bucket, folder)
+        cached = _table_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.table_cache_ttl:
+            return list(cached[1])
+
         try:
-            result = self.connection.s3_client.list_objects_v2(
+            paginator = self.connection.s3_client.get_paginator("list_objects_v2")
+            pages = paginator.paginate(
                 Bucket=self.connection.bucket,
                 Prefix=f"{folder}/",
                 Delimiter="/",
+                PaginationConfig={"PageSize": 1000},
             )
 
-            tables = []
-            if "Contents" in result:
-                tables = [
-                    obj["Key"].split("/")[-1].replace(".parquet", "")
-                    for obj in result["Contents"]
-                    if obj["Key"].endswith(".parquet")
-                ]
-
-            return sorted(tables) if tables else ["No tables found"]
+            tables = sorted(
+                os.path.splitext(obj["Key"])[0].rpartition("/")[2]
+                for page in pages
+                for obj in page.get("Contents", ())
+                if obj["Key"].endswith(".parquet")
+            )
 
         except Exception as err:
             raise MinilakeConnectionError(
                 f"Failed to list tables in folder '{folder}': {err!s}"
             ) from err
 
-    def get_table_preview(self, folder: str, table: str) -> pd.DataFrame:
+        tables = tables or ["No tables found"]
+        with _table_cache_lock:
+            if key not in _table_cache and len(_table_cache) >= TABLE_CACHE_SIZE:
+                # Evict the oldest entry
+                _table_cache.pop(next(iter(_table_cache)))
+            _table_cache[key] = (time.monotonic(), tables)
+        return list(tables)
+
+    def invalidate(self, folder: str | None = None) -> None:
+        """Drop cached table listings of the bucket after a write.
+
+        Args:
+            folder: Folder to invalidate, or None to clear every folder
+        """
+        bucket = self.connection.bucket
+        with _table_cache_lock:
+            for key in list(_table_cache):
+                if key[0] == bucket and folder in (None, key[1]):
+                    del _table_cache[key]
+
+    def get_table_preview(self, folder: str, table: str) -> "pd.DataFrame":
         """Get a preview of the table data.
 
         Args:
@@ -56,18 +96,28 @@ class MinilakeCore:
             pd.DataFrame: DataFrame containing the first 10 rows of the table
         """
         try:
-            s3_path = f"{folder}/{table}.parquet"
+            s3_path = f"{self.connection.bucket}/{folder}/{table}.parquet"
 
-            response = self.connection.s3_client.get_object(
-                Bucket=self.connection.bucket, Key=s3_path
-            )
-
-            parquet_data = response["Body"].read()
-            df = pd.read_parquet(io.BytesIO(parquet_data))
-
-            return df.head(10)
+            # Range-reads the footer and the first row group only
+            with self._s3_filesystem.open_input_file(s3_path) as source:
+                parquet_file = pq.ParquetFile(source)
+                batch = next(parquet_file.iter_batches(batch_size=10), None)
+                if batch is None:
+                    return parquet_file.schema_arrow.empty_table().to_pandas()
+                return batch.to_pandas()
 
         except Exception as err:
             raise MinilakeConnectionError(
                 f"Failed to preview table '{table}' in folder '{folder}': {err!s}"
             ) from err
+
+    @cached_property
+    def _s3_filesystem(self) -> fs.S3FileSystem:
+        """PyArrow filesystem for the MinIO connection."""
+        return fs.S3FileSystem(
+            access_key=self.connection.access_key,
+            secret_key=self.connection.secret_key,
+            endpoint_override=self.connection.endpoint,
+            scheme="http",
+            region="eu-east-1",
+        )
@@ -1,48 +1,114 @@
 """Database connection management module."""
 
+import functools
 import os
+import queue
 import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, suppress
 
 import boto3
 import duckdb
+from botocore.client import BaseClient, Config
 from botocore.exceptions import ClientError
-from dotenv import load_dotenv
 
+from minilake.config import load_env
 from minilake.core.exceptions import ConnectionError
 
 from .exceptions import MinilakeConnectionError
 
+DEFAULT_POOL_SIZE = 4
+S3_MAX_POOL_CONNECTIONS = 64
+
 
 class DBConnection:
-    """Thread-safe singleton database connection manager."""
+    """Thread-safe singleton database connection manager.
+
+    The root connection owns the database; a bounded pool of sibling cursors
+    lets independent queries run concurrently instead of queueing on it.
+    """
+
+    EXTENSIONS = ("httpfs", "parquet", "json")
+    # Loaded only when already installed, e.g. with
+    # `INSTALL cache_httpfs FROM community`, to cache repeated S3 reads
+    OPTIONAL_EXTENSIONS = ("cache_httpfs",)
 
     _instance = None
     _lock = threading.Lock()
 
+    @classmethod
+    def _get_instance(
+        cls,
+        database: str | None = ":memory:",
+        read_only: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> "DBConnection":
+        """Get the connection manager, creating it on first use."""
+        # Double-checked: once created, the instance is read without locking
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(database, read_only, pool_size)
+            return cls._instance
+
     @classmethod
     def get_connection(
-        cls, database: str | None = ":memory:", read_only: bool = False
+        cls,
+        database: str | None = ":memory:",
+        read_only: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
     ) -> duckdb.DuckDBPyConnection:
         """Get the DuckDB connection instance.
 
         Args:
             database: Path to database file or :memory: for in-memory database
             read_only: Whether to open the database in read-only mode
+            pool_size: Maximum number of pooled sibling connections
 
         Returns:
             DuckDB connection object
         """
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = cls(database, read_only)
-            return cls._instance.conn
+        return cls._get_instance(database, read_only, pool_size).conn
+
+    @classmethod
+    @contextmanager
+    def acquire(
+        cls,
+        database: str | None = ":memory:",
+        read_only: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Borrow a pooled connection, blocking until one is free.
+
+        Args:
+            database: Path to database file or :memory: for in-memory database
+            read_only: Whether to open the database in read-only mode
+            pool_size: Maximum number of pooled sibling connections
 
-    def __init__(self, database: str | None = ":memory:", read_only: bool = False):
+        Yields:
+            DuckDB connection sharing the database with the root connection
+        """
+        instance = cls._get_instance(database, read_only, pool_size)
+        conn = instance._borrow()
+        try:
+            yield conn
+        finally:
+            instance._pool.put(conn)
+
+    def __init__(
+        self,
+        database: str | None = ":memory:",
+        read_only: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
         """Initialize a new DuckDB connection.
 
         Args:
             database: Path to database file or :memory: for in-memory database
             read_only: Whether to open the database in read-only mode
+            pool_size: Maximum number of pooled sibling connections
         """
         if DBConnection._instance is not None:
             raise ConnectionError(
@@ -52,36 +118,133 @@ class DBConnection:
         try:
             self.conn = duckdb.connect(database, read_only=read_only)
             self._init_extensions()
+
+            # Siblings are opened on demand; extensions are loaded per
+            # database, so they need no setup of their own
+            self._pool_size = max(1, min(os.cpu_count() or 1, pool_size))
+            self._pool: queue.Queue[duckdb.DuckDBPyConnection] = queue.Queue(
+                self._pool_size
+            )
+            self._pool_lock = threading.Lock()
+            self._opened = 0
+
             DBConnection._instance = self
         except Exception as e:
             raise ConnectionError(f"Failed to connect to database: {e}") from e
 
+    def _borrow(self) -> duckdb.DuckDBPyConnection:
+        """Take an idle sibling, opening a new one while below the pool size.
+
+        Returns:
+            DuckDB connection sharing the database with the root connection
+        """
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            if self._opened < self._pool_size:
+                self._opened += 1
+                return self.conn.cursor()
+        return self._pool.get()
+
     def _init_extensions(self) -> None:
         """
         Initialize DuckDB extensions.
-        It should already be loaded, but we reload it to be sure.
+        Only extensions that are not loaded yet are touched (built-ins such as
+        parquet and json are skipped), and INSTALL (which may hit the extension
+        repository) only runs when missing on disk. Optional extensions are
+        never installed here.
         """
-        extensions = ["httpfs", "parquet", "json"]
+        pending = self.conn.execute(
+            "SELECT extension_name, installed FROM duckdb_extensions() "
+            "WHERE list_contains(?, extension_name) AND NOT loaded",
+            [[*self.EXTENSIONS, *self.OPTIONAL_EXTENSIONS]],
+        ).fetchall()
+
+        statements = [
+            f"LOAD {extension}"
+            if installed
+            else f"INSTALL {extension}; LOAD {extension}"
+            for extension, installed in pending
+            if installed or extension not in self.OPTIONAL_EXTENSIONS
+        ]
+        if not statements:
+            return
 
-        for extension in extensions:
-            try:
-                self.conn.execute(f"INSTALL {extension}; LOAD {extension};")
-            except duckdb.CatalogException:
-                pass
+        # IOException covers INSTALL without network access (air-gapped hosts)
+        errors = (duckdb.CatalogException, duckdb.IOException)
+        try:
+            self.conn.execute("; ".join(statements))
+        except errors:
+            # A failure aborts the batch, so retry each one to load the rest
+            for statement in statements:
+                with suppress(*errors):
+                    self.conn.execute(statement)
 
 
 def get_connection(
-    database: str | None = ":memory:", read_only: bool = False
+    database: str | None = ":memory:",
+    read_only: bool = False,
+    pool_size: int = DEFAULT_POOL_SIZE,
 ) -> duckdb.DuckDBPyConnection:
     """Get a DuckDB connection."""
-    return DBConnection.get_connection(database, read_only)
+    return DBConnection.get_connection(database, read_only, pool_size)
+
+
+def acquire(
+    database: str | None = ":memory:",
+    read_only: bool = False,
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+    """Borrow a pooled DuckDB connection for the duration of a with block."""
+    return DBConnection.acquire(database, read_only, pool_size)
+
+
+@functools.lru_cache(maxsize=4)
+def get_s3_client(
+    endpoint: str, access_key: str, secret_key: str, region: str | None = None
+) -> BaseClient:
+    """Get an S3 client, shared by every caller with the same credentials.
+
+    Building a client parses botocore's service model, which is slow; boto3
+    clients are thread-safe, so one per credential set is enough. The larger
+    connection pool lets concurrent requests reuse open connections.
+
+    Args:
+        endpoint: S3/MinIO endpoint as host:port
+        access_key: S3/MinIO access key
+        secret_key: S3/MinIO secret key
+        region: Optional AWS region
+
+    Returns:
+        Shared S3 client
+    """
+    return boto3.client(
+        "s3",
+        endpoint_url=f"http://{endpoint}",
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        aws_session_token=None,
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+        ),
+        region_name=region,
+        verify=False,
+    )
 
 
 class MinilakeConnection:
     def __init__(self):
-        """Initialize connection with MinIO service."""
+        """Initialize connection with MinIO service.
+
+        The service is not contacted here; call validate() to check access.
+        """
         try:
-            load_dotenv()
+            load_env()
 
             # login vars
             required_vars = [
@@ -99,19 +262,28 @@ class MinilakeConnection:
                     "Please check your .env file."
                 )
 
-            self.s3_client = boto3.client(
-                "s3",
-                endpoint_url="http://localhost:9000",
-                aws_access_key_id=os.getenv("MINIO_ROOT_USER"),
-                aws_secret_access_key=os.getenv("MINIO_ROOT_PASSWORD"),
-                aws_session_token=None,
-                config=boto3.session.Config(signature_version="s3v4"),
-                verify=False,
+            self.endpoint = "localhost:9000"
+            self.access_key = os.getenv("MINIO_ROOT_USER")
+            self.secret_key = os.getenv("MINIO_ROOT_PASSWORD")
+
+            self.s3_client = get_s3_client(
+                self.endpoint, self.access_key, self.secret_key
             )
 
             self.bucket = os.getenv("MINIO_DEFAULT_BUCKETS").split(",")[0]
 
-            # Test connection
+        except Exception as err:
+            raise MinilakeConnectionError(
+                f"Failed to initialize MinIO connections: {err!s}"
+            ) from err
+
+    def validate(self) -> None:
+        """Check that the MinIO credentials and bucket are usable.
+
+        Raises:
+            MinilakeConnectionError: If the bucket cannot be accessed
+        """
+        try:
             self.s3_client.list_objects_v2(
                 Bucket=self.bucket,
                 MaxKeys=1,
@@ -146,17 +318,13 @@ class MinilakeConnection:
             List[str]: List of folder names without the trailing slash
         """
         try:
-            result = self.s3_client.list_objects_v2(
-                Bucket=self.bucket,
-                Delimiter="/",
-            )
-
-            # Extract common prefixes (folders)
-            folders = []
-            if "CommonPrefixes" in result:
-                folders = [
-                    prefix["Prefix"].rstrip("/") for prefix in result["CommonPrefixes"]
-                ]
+            # A single call stops at 1000 keys, so walk every page
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            folders = {
+                prefix["Prefix"].rstrip("/")
+                for page in paginator.paginate(Bucket=self.bucket, Delimiter="/")
+                for prefix in page.get("CommonPrefixes", ())
+            }
 
             return sorted(folders)
 
@@ -164,3 +332,29 @@ class MinilakeConnection:
             raise MinilakeConnectionError(
                 f"Failed to list S3 folders: {err!s}"
             ) from err
+
+
+_minilake: MinilakeConnection | None = None
+_minilake_lock = threading.Lock()
+
+
+def get_minilake() -> MinilakeConnection:
+    """Get the process-wide MinIO connection, validated once on creation.
+
+    Returns:
+        Shared MinilakeConnection instance
+
+    Raises:
+        MinilakeConnectionError: If the connection cannot be established
+    """
+    global _minilake
+
+    connection = _minilake
+    if connection is not None:
+        return connection
+    with _minilake_lock:
+        if _minilake is None:
+            connection = MinilakeConnection()
+            connection.validate()
+            _minilake = connection
+        return _minilake
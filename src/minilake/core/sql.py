@@ -0,0 +1,48 @@
+"""Helpers for building DuckDB SQL text."""
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table, view or column name for use in SQL.
+
+    Embedded double quotes are doubled, so any name is read as a single
+    identifier.
+
+    Args:
+        name: Identifier to quote
+
+    Returns:
+        Double-quoted SQL identifier
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    """Render a value as a quoted SQL string literal.
+
+    Only for statements that cannot take prepared parameters, such as view
+    definitions and CREATE SECRET.
+
+    Args:
+        value: Value to quote
+
+    Returns:
+        Single-quoted SQL string literal with embedded quotes escaped
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def quote_paths(paths: str | list[str]) -> str:
+    """Render a path or list of paths as a SQL literal for a file scan.
+
+    Views cannot hold prepared parameters, so the paths they scan are inlined
+    with this instead.
+
+    Args:
+        paths: Path or list of paths
+
+    Returns:
+        Quoted SQL string literal, or a list literal for a list of paths
+    """
+    if isinstance(paths, list):
+        return "[" + ", ".join(map(quote_literal, paths)) + "]"
+    return quote_literal(paths)
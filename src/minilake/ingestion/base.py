@@ -1,5 +1,6 @@
 """Base interfaces for data ingestion."""
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -14,7 +15,7 @@ class IngestionStrategy(ABC):
     def ingest(
         self,
         conn: duckdb.DuckDBPyConnection,
-        file_path: Path,
+        file_path: Path | list[Path],
         table_name: str,
         schema: dict[str, str] | None = None,
         batch_size: int | None = None,
@@ -24,10 +25,27 @@ class IngestionStrategy(ABC):
 
         Args:
             conn: DuckDB connection
-            file_path: Path to the file to ingest
+            file_path: Path, glob or list of paths to the file(s) to ingest
             table_name: Name of the DuckDB table to create
             schema: Optional schema definition
             batch_size: Optional batch size for large files
             kwargs: Additional format-specific parameters
         """
         pass
+
+    @staticmethod
+    def _source(file_path: Path | list[Path]) -> str | list[str]:
+        """Convert file path(s) into a DuckDB reader argument.
+
+        Lists are forwarded whole so DuckDB scans all files in a single
+        parallel read instead of one statement per file.
+
+        Args:
+            file_path: Path, glob or list of paths
+
+        Returns:
+            Path string or list of path strings
+        """
+        if isinstance(file_path, list | tuple):
+            return [os.fspath(path) for path in file_path]
+        return os.fspath(file_path)
@@ -6,6 +6,7 @@ from typing import Any
 import duckdb
 
 from minilake.core.exceptions import IngestionError
+from minilake.core.sql import quote_identifier
 from minilake.ingestion.base import IngestionStrategy
 
 
@@ -15,7 +16,7 @@ class CsvIngestion(IngestionStrategy):
     def ingest(
         self,
         conn: duckdb.DuckDBPyConnection,
-        file_path: Path,
+        file_path: Path | list[Path],
         table_name: str,
         schema: dict[str, str] | None = None,
         batch_size: int | None = None,
@@ -25,44 +26,39 @@ class CsvIngestion(IngestionStrategy):
 
         Args:
             conn: DuckDB connection
-            file_path: Path to the CSV file
+            file_path: Path, glob or list of paths to the CSV file(s)
             table_name: Name of the DuckDB table to create
             schema: Optional schema definition
             batch_size: Not used for CSV
             kwargs: Additional parameters like delimiter, header, etc.
         """
         try:
+            source = self._source(file_path)
             if schema:
-                schema_sql = self._create_schema(schema)
-                conn.execute(f'CREATE TABLE "{table_name}" {schema_sql}')
+                # Explicit columns skip the sniffer, and typing them in the
+                # scan creates and fills the table in a single statement
                 conn.execute(
                     f"""
-                    INSERT INTO "{table_name}"
-                    SELECT * FROM read_csv(?)
+                    CREATE TABLE {quote_identifier(table_name)} AS
+                    SELECT * FROM read_csv(
+                        ?, columns = ?, auto_detect = false, header = ?, delim = ?
+                    )
                 """,
-                    [str(file_path)],
+                    [
+                        source,
+                        schema,
+                        kwargs.get("header", True),
+                        kwargs.get("delimiter", ","),
+                    ],
                 )
             else:
                 # Auto-detect schema
                 conn.execute(
                     f"""
-                    CREATE TABLE "{table_name}" AS
+                    CREATE TABLE {quote_identifier(table_name)} AS
                     SELECT * FROM read_csv(?)
                 """,
-                    [str(file_path)],
+                    [source],
                 )
         except Exception as e:
             raise IngestionError(f"Error ingesting CSV file: {e!s}") from e
-
-    @staticmethod
-    def _create_schema(schema: dict[str, str]) -> str:
-        """Create a SQL schema string from a dictionary.
-
-        Args:
-            schema: Dictionary mapping column names to types
-
-        Returns:
-            SQL schema string
-        """
-        columns = [f'"{col}" {dtype}' for col, dtype in schema.items()]
-        return f"({', '.join(columns)})"
@@ -6,6 +6,7 @@ from typing import Any
 import duckdb
 
 from minilake.core.exceptions import IngestionError
+from minilake.core.sql import quote_identifier, quote_paths
 from minilake.ingestion.base import IngestionStrategy
 
 
@@ -15,7 +16,7 @@ class ParquetIngestion(IngestionStrategy):
     def ingest(
         self,
         conn: duckdb.DuckDBPyConnection,
-        file_path: Path,
+        file_path: Path | list[Path],
         table_name: str,
         schema: dict[str, str] | None = None,
         batch_size: int | None = None,
@@ -25,17 +26,26 @@ class ParquetIngestion(IngestionStrategy):
 
         Args:
             conn: DuckDB connection
-            file_path: Path to the Parquet file
+            file_path: Path, glob or list of paths to the Parquet file(s)
             table_name: Name of the DuckDB table to create
             schema: Not used for Parquet (schema is derived from file)
             batch_size: Not used for Parquet
-            kwargs: Additional parameters (not used)
+            kwargs: Additional parameters:
+                materialize: Copy the data into a table (default) or, when
+                    False, create a view that scans the file(s) on demand
         """
         try:
-            query = f"""
-            CREATE TABLE "{table_name}" AS
-            SELECT * FROM read_parquet(?)
-            """
-            conn.execute(query, [str(file_path)])
+            source = self._source(file_path)
+            if kwargs.get("materialize", True):
+                query = f"""
+                CREATE TABLE {quote_identifier(table_name)} AS
+                SELECT * FROM read_parquet(?)
+                """
+                conn.execute(query, [source])
+            else:
+                conn.execute(
+                    f"CREATE VIEW {quote_identifier(table_name)} AS "
+                    f"SELECT * FROM read_parquet({quote_paths(source)})"
+                )
         except Exception as e:
             raise IngestionError(f"Error ingesting Parquet file: {e!s}") from e
@@ -1,14 +1,26 @@
 """SQL query execution functionality."""
 
-from typing import Any
+import re
+import uuid
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 import duckdb
-import pandas as pd
-import polars as pl
+import pyarrow as pa
 
-from minilake.core.connection import get_connection
+from minilake.core.connection import acquire, get_connection
 from minilake.core.exceptions import QueryError
-from minilake.storage.factory import create_storage
+from minilake.core.sql import quote_identifier
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+    from minilake.storage.base import StorageInterface
+
+_DELTA_TABLE_RE = re.compile(r"\bFROM\s+delta_table\b", re.IGNORECASE)
 
 
 class QueryExecutor:
@@ -18,87 +30,132 @@ class QueryExecutor:
         """Initialize the query executor.
 
         Args:
-            conn: Optional DuckDB connection
+            conn: Optional DuckDB connection, queries use the pool when omitted
         """
+        self._pooled = conn is None
         self.conn = conn or get_connection()
-        self.storage = create_storage()
+
+    @cached_property
+    def storage(self) -> "StorageInterface":
+        """Delta storage, created on first use.
+
+        deltalake pulls in pandas, so it is only imported once a Delta table
+        is actually queried.
+        """
+        from minilake.storage.factory import create_storage
+
+        return create_storage()
+
+    def _connection(self) -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+        """Get the connection to run a query on, pooled unless one was given."""
+        if self._pooled:
+            return acquire()
+        return nullcontext(self.conn)
 
     def execute_query(
         self, query: str, output_format: str = "pandas", **kwargs: Any
-    ) -> pd.DataFrame | pl.DataFrame:
+    ) -> "pd.DataFrame | pl.DataFrame | pa.Table":
         """Execute a SQL query.
 
         Args:
             query: SQL query to execute
-            output_format: Output format ("pandas" or "polars")
+            output_format: Output format ("pandas", "polars" or "arrow")
             kwargs: Additional parameters
 
         Returns:
-            Query results as a DataFrame
+            Query results as a DataFrame, or an Arrow table for "arrow"
 
         Raises:
             QueryError: If the query fails
         """
         try:
-            if output_format.lower() == "pandas":
-                return self.conn.execute(query).df()
-            elif output_format.lower() == "polars":
-                return self.conn.execute(query).pl()
-            else:
-                raise QueryError(f"Unsupported output format: {output_format}")
+            with self._connection() as conn:
+                return self._fetch(conn, query, output_format)
         except Exception as e:
             raise QueryError(f"Error executing query: {e!s}") from e
 
+    @staticmethod
+    def _fetch(
+        conn: duckdb.DuckDBPyConnection, query: str, output_format: str
+    ) -> "pd.DataFrame | pl.DataFrame | pa.Table":
+        """Run a query on a connection and fetch the result in a given format.
+
+        Args:
+            conn: Connection to run the query on
+            query: SQL query to execute
+            output_format: Output format ("pandas", "polars" or "arrow")
+
+        Returns:
+            Query results as a DataFrame, or an Arrow table for "arrow"
+
+        Raises:
+            QueryError: If the output format is not supported
+        """
+        if output_format.lower() == "pandas":
+            return conn.execute(query).df()
+        elif output_format.lower() == "polars":
+            return conn.execute(query).pl()
+        elif output_format.lower() == "arrow":
+            return conn.execute(query).fetch_arrow_table()
+        else:
+            raise QueryError(f"Unsupported output format: {output_format}")
+
     def query_delta_table(
         self,
         delta_path: str,
         query: str,
         temp_table: str | None | None = None,
         version: int | None = None,
-        timestamp: str | None = None,
+        timestamp: str | datetime | None = None,
         output_format: str = "pandas",
         **kwargs: Any,
-    ) -> pd.DataFrame | pl.DataFrame:
+    ) -> "pd.DataFrame | pl.DataFrame | pa.Table":
         """Query a Delta table.
 
         Args:
             delta_path: Path to the Delta table
             query: SQL query to execute
-            temp_table: Name of temporary table (generated if None)
+            temp_table: Name of temporary view (generated if None)
             version: Optional specific version to query
-            timestamp: Optional timestamp to query data as of
-            output_format: Output format ("pandas" or "polars")
+            timestamp: Optional timestamp to query data as of, as a datetime or
+                an ISO 8601 string; naive values are read as UTC
+            output_format: Output format ("pandas", "polars" or "arrow")
             kwargs: Additional parameters
 
         Returns:
-            Query results as a DataFrame (Pandas or Polars)
+            Query results as a DataFrame (Pandas or Polars) or an Arrow table
 
         Raises:
             QueryError: Query failed
         """
         if temp_table is None:
-            temp_table = f"temp_{delta_path.replace('/', '_')}_{id(self)}"
+            # Unique per call, so concurrent calls never clash on a name
+            temp_table = f"temp_{uuid.uuid4().hex}"
 
-        try:
-            # Loading Delta table into DuckDB
-            self.storage.read_to_duckdb(delta_path, temp_table, version, timestamp)
-
-            # Ensure the table name is properly referenced
-            if query.strip().upper().startswith("SELECT"):
-                modified_query = query.replace("FROM delta_table", f"FROM {temp_table}")
-                if modified_query == query:  # Not replaced
-                    modified_query = query
-            else:
-                modified_query = query
-
-            # Executing query
-            result = self.execute_query(modified_query, output_format, **kwargs)
-
-            return result
-        except Exception as e:
-            raise QueryError(f"Error querying Delta table: {e!s}") from e
-        finally:
+        with self._connection() as conn:
             try:
-                self.conn.execute(f'DROP TABLE IF EXISTS "{temp_table}"')
-            except Exception:
-                pass
+                # Expose the Delta table as a temporary view on the connection
+                # running the query, so filters and projections are pushed
+                # down into the Parquet scan, even on a read-only database
+                self.storage.read_to_duckdb(
+                    delta_path,
+                    temp_table,
+                    version,
+                    timestamp,
+                    materialize=False,
+                    conn=conn,
+                )
+
+                # Point references to delta_table at the view
+                modified_query = _DELTA_TABLE_RE.sub(
+                    lambda _: f"FROM {quote_identifier(temp_table)}", query
+                )
+
+                return self._fetch(conn, modified_query, output_format)
+            except Exception as e:
+                raise QueryError(f"Error querying Delta table: {e!s}") from e
+            finally:
+                try:
+                    conn.execute(f"DROP VIEW IF EXISTS {quote_identifier(temp_table)}")
+                except Exception:
+                    pass
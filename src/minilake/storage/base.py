@@ -1,10 +1,82 @@
 """Base interfaces for storage implementations."""
 
+import json
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
+import duckdb
 import pyarrow as pa
+from deltalake import DeltaTable
+
+
+@dataclass
+class TableInfo(Mapping[str, Any]):
+    """Metadata about a Delta table.
+
+    The file list and commit history are only read from the table log when
+    first accessed, so callers that just need the version or schema skip
+    listing the table's files. Both are read at `version`, even when the
+    table has been written to since.
+
+    get_table_info used to return a dict, so its keys can still be read as
+    items. `info["schema"]` keeps the Delta JSON schema of that dict, while
+    `info.schema` is the Arrow schema.
+
+    Attributes:
+        version: Current table version
+        metadata: Delta table metadata
+        schema: Table schema as a PyArrow schema
+        history_limit: Maximum number of commits returned by history
+    """
+
+    # Keys of the dict get_table_info returned before
+    _KEYS = ("version", "metadata", "files", "history", "schema")
+
+    version: int
+    metadata: Any
+    schema: pa.Schema
+    _open_table: Callable[[], DeltaTable] = field(repr=False)
+    _list_files: Callable[[DeltaTable], list[str]] = field(repr=False)
+    history_limit: int | None = None
+
+    @cached_property
+    def files(self) -> list[str]:
+        """Data files of the table, relative to the table root."""
+        return self._list_files(self._open_table())
+
+    @cached_property
+    def history(self) -> list[dict[str, Any]]:
+        """Commit history of the table up to `version`, newest first."""
+        dt = self._open_table()
+        if self.history_limit is None:
+            return [c for c in dt.history() if c["version"] <= self.version]
+
+        # history() starts at the newest commit in the log, not at the loaded
+        # version, so read further back until enough older commits are found
+        limit = self.history_limit
+        while True:
+            commits = dt.history(limit)
+            kept = [c for c in commits if c["version"] <= self.version]
+            if len(kept) >= self.history_limit or len(commits) < limit:
+                return kept[: self.history_limit]
+            limit *= 2
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "schema":
+            return json.loads(self._open_table().schema().to_json())
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
 
 
 class StorageInterface(ABC):
@@ -18,6 +90,7 @@ class StorageInterface(ABC):
         partition_by: list[str] | None = None,
         schema: pa.Schema | None = None,
         mode: str = "overwrite",
+        sort_by: list[str] | None = None,
     ) -> None:
         """Create a Delta table from a DuckDB table.
 
@@ -27,6 +100,7 @@ class StorageInterface(ABC):
             partition_by: Optional columns to partition by
             schema: Optional PyArrow schema to enforce
             mode: Write mode ("overwrite" or "append")
+            sort_by: Optional columns to sort rows by before writing
         """
         pass
 
@@ -37,6 +111,10 @@ class StorageInterface(ABC):
         table_name: str,
         version: int | None = None,
         timestamp: str | datetime | None = None,
+        columns: list[str] | None = None,
+        materialize: bool = True,
+        partition_filters: list[tuple[str, str, Any]] | None = None,
+        conn: duckdb.DuckDBPyConnection | None = None,
     ) -> None:
         """Read a Delta table into DuckDB.
 
@@ -44,19 +122,31 @@ class StorageInterface(ABC):
             delta_path: Path to the Delta table
             table_name: Name of the DuckDB table to create
             version: Optional specific version to load
-            timestamp: Optional timestamp to load data as of
+            timestamp: Optional timestamp to load data as of, as a datetime or
+                an ISO 8601 string; naive values are read as UTC
+            columns: Optional subset of columns to load
+            materialize: Copy the data into a table (default) or, when False,
+                create a view that scans the Delta files on demand
+            partition_filters: Optional (column, op, value) filters on partition
+                columns; files of other partitions are skipped using the log
+            conn: Optional connection to create a temporary table or view on,
+                visible to that connection only; when omitted, a persistent one
+                is created on the storage connection
         """
         pass
 
     @abstractmethod
-    def get_table_info(self, delta_path: str) -> dict[str, Any]:
+    def get_table_info(
+        self, delta_path: str, history_limit: int | None = None
+    ) -> TableInfo:
         """Get information about a Delta table.
 
         Args:
             delta_path: Path to the Delta table
+            history_limit: Optional maximum number of commits in the history
 
         Returns:
-            Dictionary containing table metadata
+            Table version, metadata and schema
         """
         pass
 
@@ -1,18 +1,29 @@
 """Delta Lake storage implementation."""
 
-import json
+import functools
+import os
+import threading
 from abc import abstractmethod
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 import duckdb
 import pyarrow as pa
 from deltalake import DeltaTable, write_deltalake
 from deltalake.writer import WriterProperties
-from pyarrow.lib import TimestampType
 
 from minilake.core.exceptions import StorageError
-from minilake.storage.base import StorageInterface
+from minilake.core.sql import quote_identifier, quote_paths
+from minilake.storage.base import StorageInterface, TableInfo
+
+WRITE_BATCH_SIZE = 1_000_000
+ROW_GROUP_SIZE = 100_000
+DELTA_TABLE_CACHE_SIZE = 32
+DELTA_FILES_CACHE_SIZE = 32
+OPTIMIZE_TARGET_SIZE = 256 * 1024 * 1024
+MAINTENANCE_WORKERS = 4
 
 
 class DeltaStorage(StorageInterface):
@@ -35,6 +46,13 @@ class DeltaStorage(StorageInterface):
         """
         self.conn = conn
         self.storage_options = storage_options
+        # Each handle has its own lock for refreshes; the shared lock only
+        # guards the dicts, so log reads of different tables run in parallel
+        self._delta_tables: dict[
+            tuple[str, Any, Any], tuple[DeltaTable, threading.Lock]
+        ] = {}
+        self._delta_tables_lock = threading.Lock()
+        self._delta_files: dict[tuple[str, int], list[str]] = {}
 
     @abstractmethod
     def _get_delta_path(self, delta_path: str) -> str:
@@ -55,6 +73,7 @@ class DeltaStorage(StorageInterface):
         partition_by: list[str] | None = None,
         schema: pa.Schema | None = None,
         mode: str = "overwrite",
+        sort_by: list[str] | None = None,
     ) -> None:
         """Create Delta table from DuckDB table.
 
@@ -64,6 +83,8 @@ class DeltaStorage(StorageInterface):
             partition_by: List of column names to partition by
             schema: Optional PyArrow schema to cast data
             mode: Write mode ('overwrite' or 'append')
+            sort_by: Optional columns to sort rows by before writing, so the
+                Parquet min/max statistics let readers skip row groups
 
         Raises:
             StorageError: If table creation fails
@@ -71,31 +92,30 @@ class DeltaStorage(StorageInterface):
         try:
             _path = self._get_delta_path(delta_path)
 
-            # Fetch data from DuckDB
-            table = self.conn.execute(f'SELECT * FROM "{table_name}"').arrow()
+            # Stream batches from DuckDB so the table is never held in memory.
+            # Binding the name keeps the SQL text constant across tables.
+            query = "SELECT * FROM query_table(?)"
+            if sort_by:
+                query += f" ORDER BY {self._select_list(sort_by)}"
+            data = self.conn.execute(query, [table_name]).fetch_record_batch(
+                WRITE_BATCH_SIZE
+            )
 
             # Apply schema if provided
             if schema:
-                table = table.cast(schema)
-
-            # Check if schema has timestamp columns
-            has_timestamp = False
-            if schema:
-                has_timestamp = any(
-                    isinstance(field.type, TimestampType) for field in schema
+                data = pa.RecordBatchReader.from_batches(
+                    schema, (batch.cast(schema) for batch in data)
                 )
 
-            writer_props = WriterProperties() if has_timestamp else None
-
             write_deltalake(
                 str(_path),
-                table,
+                data,
                 mode=mode,
                 partition_by=partition_by,
                 storage_options=self.storage_options,
                 engine="rust",
                 schema_mode="overwrite",
-                writer_properties=writer_props,
+                writer_properties=self._writer_properties(),
             )
         except Exception as e:
             raise StorageError(f"Error creating Delta table: {e!s}") from e
@@ -106,79 +126,318 @@ class DeltaStorage(StorageInterface):
         table_name: str,
         version: int | None = None,
         timestamp: str | datetime | None = None,
+        columns: list[str] | None = None,
+        materialize: bool = True,
+        partition_filters: list[tuple[str, str, Any]] | None = None,
+        conn: duckdb.DuckDBPyConnection | None = None,
     ) -> None:
         """Read a Delta table into DuckDB."""
         try:
             _path = self._get_delta_path(delta_path)
 
-            dt_args = {"table_uri": str(_path), "storage_options": self.storage_options}
-
-            if version is not None:
-                dt_args["version"] = version
-            elif timestamp is not None:
-                dt_args["timestamp"] = timestamp
+            dt = self._get_delta_table(delta_path, version, timestamp)
 
-            dt = DeltaTable(**dt_args)
-
-            files = dt.files()
+            # Partition values are recorded in the log, so pruning needs no I/O
+            if partition_filters:
+                files = dt.files(partition_filters)
+            else:
+                files = self._get_files(dt)
             if not files:
                 raise StorageError("No files found in Delta table")
 
-            self._load_delta_files(files, _path, table_name)
+            self._load_delta_files(files, _path, table_name, columns, materialize, conn)
 
         except Exception as e:
             raise StorageError(f"Error reading Delta table: {e!s}") from e
 
-    def get_table_info(self, delta_path: str) -> dict[str, Any]:
+    def get_table_info(
+        self, delta_path: str, history_limit: int | None = None
+    ) -> TableInfo:
         """Get information about a Delta table."""
         try:
-            _path = self._get_delta_path(delta_path)
-
-            dt = DeltaTable(str(_path), storage_options=self.storage_options)
-
-            schema_str = json.loads(dt.schema().to_json())
-
-            return {
-                "version": dt.version(),
-                "metadata": dt.metadata(),
-                "files": dt.files(),
-                "history": dt.history(),
-                "schema": schema_str,
-            }
+            dt = self._get_delta_table(delta_path)
+            version = dt.version()
+
+            return TableInfo(
+                version=version,
+                metadata=dt.metadata(),
+                schema=dt.schema().to_pyarrow(),
+                # Pinned handles are never refreshed, unlike the cached latest
+                # one, so lazy reads stay at this version after later writes
+                _open_table=functools.partial(
+                    self._get_delta_table, delta_path, version
+                ),
+                _list_files=self._get_files,
+                history_limit=history_limit,
+            )
         except Exception as e:
             raise StorageError(f"Error getting table info: {e!s}") from e
 
     def vacuum(self, delta_path: str, retention: int | None = 168) -> None:
         """Clean up old versions of a Delta table."""
         try:
-            _path = self._get_delta_path(delta_path)
-
-            dt = DeltaTable(str(_path), storage_options=self.storage_options)
+            dt = self._get_delta_table(delta_path)
 
             if retention is not None and retention < 168:
                 retention = 168  # set to 7 days minimum
 
-            dt.vacuum(retention_hours=retention)
+            # vacuum() only lists the files it would delete unless dry_run is off
+            dt.vacuum(retention_hours=retention, dry_run=False)
         except Exception as e:
             raise StorageError(f"Error vacuuming Delta table: {e!s}") from e
 
     def optimize(self, delta_path: str, zorder_by: list[str] | None = None) -> None:
-        """Optimize a Delta table."""
-        try:
-            _path = self._get_delta_path(delta_path)
+        """Optimize a Delta table.
 
-            dt = DeltaTable(str(_path), storage_options=self.storage_options)
+        Small files are rewritten into files of about OPTIMIZE_TARGET_SIZE, so
+        later scans issue fewer requests. Z-ordering rewrites every file anyway,
+        so it replaces compaction rather than following it.
+        """
+        try:
+            dt = self._get_delta_table(delta_path)
 
             if zorder_by:
-                dt.optimize.compact()
-                dt.optimize.z_order(zorder_by)
+                dt.optimize.z_order(
+                    zorder_by,
+                    target_size=OPTIMIZE_TARGET_SIZE,
+                    writer_properties=self._writer_properties(),
+                )
             else:
-                dt.optimize.compact()
+                dt.optimize.compact(
+                    target_size=OPTIMIZE_TARGET_SIZE,
+                    writer_properties=self._writer_properties(),
+                )
         except Exception as e:
             raise StorageError(f"Error optimizing Delta table: {e!s}") from e
 
+    def maintain(
+        self,
+        delta_paths: list[str],
+        retention: int | None = 168,
+        zorder_by: list[str] | None = None,
+        max_workers: int = MAINTENANCE_WORKERS,
+    ) -> None:
+        """Optimize and then vacuum several Delta tables concurrently.
+
+        Maintenance is dominated by file I/O, during which delta-rs releases
+        the GIL, so tables are processed in parallel threads.
+
+        Args:
+            delta_paths: Paths to the Delta tables
+            retention: Retention period in hours (minimum 168 hours/7 days)
+            zorder_by: Optional columns to z-order every table by
+            max_workers: Maximum number of tables processed at once
+
+        Raises:
+            StorageError: If maintenance fails for any table, after all
+                tables have been attempted
+        """
+
+        def run(delta_path: str) -> None:
+            self.optimize(delta_path, zorder_by)
+            self.vacuum(delta_path, retention)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                delta_path: executor.submit(run, delta_path)
+                for delta_path in delta_paths
+            }
+
+        errors = [
+            f"{delta_path}: {future.exception()!s}"
+            for delta_path, future in futures.items()
+            if future.exception() is not None
+        ]
+        if errors:
+            raise StorageError("Error maintaining Delta tables: " + "; ".join(errors))
+
+    def _get_delta_table(
+        self,
+        delta_path: str,
+        version: int | None = None,
+        timestamp: str | datetime | None = None,
+    ) -> DeltaTable:
+        """Get a DeltaTable handle, reusing a cached one when possible.
+
+        Pinned versions never change and are returned as is, while the latest
+        version is refreshed with update_incremental, which only reads the
+        commits added since it was last loaded.
+
+        Args:
+            delta_path: Path to the Delta table
+            version: Optional specific version to load
+            timestamp: Optional timestamp to load data as of, as a datetime or
+                an ISO 8601 string; naive values are read as UTC
+
+        Returns:
+            DeltaTable at the requested version
+        """
+        _path = str(self._get_delta_path(delta_path))
+        # delta-rs only parses strings with an offset, so normalise them here
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        if timestamp is not None and timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=UTC)
+        key = (_path, version, timestamp)
+
+        with self._delta_tables_lock:
+            entry = self._delta_tables.get(key)
+
+        if entry is None:
+            dt = DeltaTable(
+                _path, version=version, storage_options=self.storage_options
+            )
+            if version is None and timestamp is not None:
+                dt.load_as_version(timestamp)
+            with self._delta_tables_lock:
+                if (
+                    key not in self._delta_tables
+                    and len(self._delta_tables) >= DELTA_TABLE_CACHE_SIZE
+                ):
+                    self._delta_tables.pop(next(iter(self._delta_tables)))
+                # A concurrent load of the same key may have finished first
+                entry = self._delta_tables.setdefault(key, (dt, threading.Lock()))
+            return entry[0]
+
+        dt, lock = entry
+        if version is None and timestamp is None:
+            with lock:
+                dt.update_incremental()
+        return dt
+
+    def _get_files(self, dt: DeltaTable) -> list[str]:
+        """List the data files of a table version, reusing earlier listings.
+
+        A version's files never change, so listings are cached per table and
+        version; callers must not modify the returned list.
+
+        Args:
+            dt: Delta table handle at the version to list
+
+        Returns:
+            Data files relative to the table root
+        """
+        key = (dt.table_uri, dt.version())
+        with self._delta_tables_lock:
+            files = self._delta_files.get(key)
+        if files is None:
+            files = dt.files()
+            with self._delta_tables_lock:
+                if len(self._delta_files) >= DELTA_FILES_CACHE_SIZE:
+                    self._delta_files.pop(next(iter(self._delta_files)))
+                self._delta_files[key] = files
+        return files
+
     def _load_delta_files(
-        self, files: list[str], delta_path: str, table_name: str
+        self,
+        files: list[str],
+        delta_path: str | Path,
+        table_name: str,
+        columns: list[str] | None = None,
+        materialize: bool = True,
+        conn: duckdb.DuckDBPyConnection | None = None,
     ) -> None:
-        """Load Delta table files into DuckDB."""
-        pass  # Implementation depends on storage type
+        """Load Delta table files into DuckDB.
+
+        Args:
+            files: Data files of the Delta version, relative to the table root
+            delta_path: Full path or URI of the Delta table
+            table_name: Name of the DuckDB table or view to create
+            columns: Optional subset of columns to load
+            materialize: Create a table (True) or a view (False)
+            conn: Optional connection to create a temporary table or view on
+
+        Raises:
+            StorageError: If the files cannot be loaded
+        """
+        try:
+            root = str(delta_path)
+            self._prepare_scan(root)
+
+            # Object store URIs are joined with "/", local paths by the OS
+            if "://" in root:
+                file_paths = [f"{root.rstrip('/')}/{file}" for file in files]
+            else:
+                file_paths = [os.path.join(root, file) for file in files]
+
+            self._scan_files(table_name, file_paths, columns, materialize, conn)
+        except Exception as e:
+            raise StorageError(f"Error loading Delta files into DuckDB: {e!s}") from e
+
+    def _prepare_scan(self, delta_path: str) -> None:
+        """Prepare the connection before scanning a table's files.
+
+        Args:
+            delta_path: Full path or URI of the Delta table
+        """
+
+    def _scan_files(
+        self,
+        table_name: str,
+        file_paths: list[str],
+        columns: list[str] | None = None,
+        materialize: bool = True,
+        conn: duckdb.DuckDBPyConnection | None = None,
+    ) -> None:
+        """Create a DuckDB table or view over Delta data files.
+
+        One scan over all files lets DuckDB read them in parallel; as a view,
+        filters and projections of later queries are pushed into that scan.
+        Columns are matched by name, so files written before a schema change
+        read their missing columns as NULL.
+
+        Args:
+            table_name: Name of the DuckDB table or view to create
+            file_paths: Full paths of the Parquet files of the Delta version
+            columns: Optional subset of columns to expose
+            materialize: Create a table (True) or a view (False)
+            conn: Optional connection to create a temporary table or view on,
+                instead of a persistent one on the storage connection
+        """
+        select_list = self._select_list(columns)
+        temp = "" if conn is None else "TEMP "
+        if conn is None:
+            conn = self.conn
+        if materialize:
+            conn.execute(
+                f"CREATE OR REPLACE {temp}TABLE {quote_identifier(table_name)} AS "
+                f"SELECT {select_list} FROM parquet_scan(?, union_by_name = true)",
+                [file_paths],
+            )
+        else:
+            conn.execute(
+                f"CREATE OR REPLACE {temp}VIEW {quote_identifier(table_name)} AS "
+                f"SELECT {select_list} "
+                f"FROM parquet_scan({quote_paths(file_paths)}, union_by_name = true)"
+            )
+
+    @staticmethod
+    def _writer_properties() -> WriterProperties:
+        """Build the Parquet writer settings for data files.
+
+        ZSTD files are much smaller than the default Snappy ones at a similar
+        decode cost, so every later scan moves fewer bytes; smaller row groups
+        let DuckDB split a file across threads.
+
+        Returns:
+            Writer properties for write_deltalake and optimize
+        """
+        return WriterProperties(
+            compression="ZSTD",
+            compression_level=3,
+            max_row_group_size=ROW_GROUP_SIZE,
+        )
+
+    @staticmethod
+    def _select_list(columns: list[str] | None) -> str:
+        """Build the SELECT list so only the requested columns are scanned.
+
+        Args:
+            columns: Column names to project, or None for all columns
+
+        Returns:
+            Quoted, comma-separated column list or "*"
+        """
+        if not columns:
+            return "*"
+        return ", ".join(map(quote_identifier, columns))
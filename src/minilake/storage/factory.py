@@ -23,7 +23,11 @@ def create_storage(config: Config | None = None) -> StorageInterface:
     if config is None:
         config = Config.from_env()
 
-    conn = get_connection(config.database.path)
+    conn = get_connection(
+        config.database.path,
+        read_only=config.database.read_only,
+        pool_size=config.database.pool_size,
+    )
 
     if config.storage.type == "local":
         return LocalDeltaStorage(conn=conn, delta_root=config.storage.delta_root)
@@ -2,7 +2,6 @@
 
 from pathlib import Path
 
-from minilake.core.exceptions import StorageError
 from minilake.storage.delta import DeltaStorage
 
 
@@ -23,31 +22,3 @@ class LocalDeltaStorage(DeltaStorage):
     def _get_delta_path(self, delta_path: str) -> Path:
         """Get the full path to a Delta table."""
         return self.delta_root / delta_path
-
-    def _load_delta_files(
-        self, files: list[str], delta_path: Path, table_name: str
-    ) -> None:
-        """Load Delta table files into DuckDB."""
-        try:
-            file_paths = []
-            for file in files:
-                file_paths.append(str(delta_path / file))
-
-            # Create table from first file
-            create_query = f"""
-                CREATE OR REPLACE TABLE "{table_name}" AS
-                SELECT * FROM parquet_scan('{file_paths[0]}')
-            """
-            self.conn.execute(create_query)
-
-            # Add data from other files
-            if len(file_paths) > 1:
-                for file_path in file_paths[1:]:
-                    insert_query = f"""
-                        INSERT INTO "{table_name}"
-                        SELECT * FROM parquet_scan('{file_path}')
-                    """
-                    self.conn.execute(insert_query)
-
-        except Exception as e:
-            raise StorageError(f"Error loading Delta files into DuckDB: {e!s}") from e
@@ -1,11 +1,14 @@
 """S3/MinIO storage implementation for Delta Lake."""
 
+from functools import cached_property
 from pathlib import Path
 
-import boto3
-from botocore.client import Config
+import duckdb
+from botocore.client import BaseClient
 
-from minilake.core.exceptions import ConfigurationError, StorageError
+from minilake.core.connection import get_s3_client
+from minilake.core.exceptions import ConfigurationError
+from minilake.core.sql import quote_identifier, quote_literal
 from minilake.storage.delta import DeltaStorage
 
 
@@ -50,15 +53,21 @@ class S3Manager(DeltaStorage):
         self.endpoint = endpoint
         self.bucket = bucket
         self.delta_root = delta_root
+        self._s3_configured = False
 
-        # Initialize S3 client
-        self.s3_client = boto3.client(
-            "s3",
-            endpoint_url=f"http://{endpoint}",
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            config=Config(signature_version="s3v4"),
-            region_name=region,
+    @cached_property
+    def s3_client(self) -> BaseClient:
+        """S3 client for direct bucket access, created on first use.
+
+        Table reads and writes go through DuckDB and delta-rs, which open
+        their own connections, so most storages never need it.
+        """
+        options = self.storage_options
+        return get_s3_client(
+            self.endpoint,
+            options["AWS_ACCESS_KEY_ID"],
+            options["AWS_SECRET_ACCESS_KEY"],
+            options["AWS_REGION"],
         )
 
     def _get_delta_path(self, delta_path: str) -> str:
@@ -72,76 +81,46 @@ class S3Manager(DeltaStorage):
 
         return f"s3://{self.bucket}/{delta_root}/{delta_path}"
 
-    def _load_delta_files(
-        self, files: list[str], delta_path: str, table_name: str
-    ) -> None:
-        """Load Delta table files into DuckDB."""
+    def _configure_s3(self) -> None:
+        """Load httpfs and register the S3 credentials on the connection, once.
+
+        The credentials are stored as a DuckDB secret scoped to the bucket, so
+        httpfs reuses them for every scan of it. The HTTP metadata cache keeps
+        object sizes and the object cache keeps Parquet footers between
+        queries, saving round trips when a table's files are scanned again;
+        extra retries ride out transient errors.
+        """
+        if self._s3_configured:
+            return
+
+        # Only reach for the network when the extension is not installed yet
         try:
-            # Check if we're using local filesystem
-            if Path(delta_path).is_absolute() or not delta_path.startswith("s3://"):
-                # Configure DuckDB for local filesystem
-                self.conn.execute("SET enable_http_metadata_cache=false")
-
-                # Prepare file paths
-                file_paths = []
-                for file in files:
-                    file_paths.append(str(Path(delta_path) / file))
-
-                # Create table from first file
-                create_query = f"""
-                    CREATE OR REPLACE TABLE "{table_name}" AS
-                    SELECT * FROM parquet_scan('{file_paths[0]}')
-                """
-                self.conn.execute(create_query)
-
-                # Add data from other files
-                if len(file_paths) > 1:
-                    for file_path in file_paths[1:]:
-                        insert_query = f"""
-                            INSERT INTO "{table_name}"
-                            SELECT * FROM parquet_scan('{file_path}')
-                        """
-                        self.conn.execute(insert_query)
-                return
-
-            # S3/MinIO specific setup
-            try:
-                self.conn.execute("INSTALL httpfs")
-                self.conn.execute("LOAD httpfs")
-            except Exception:
-                pass
-
-            # Configure S3 connection in DuckDB
-            self.conn.execute("SET s3_region='eu-east-1'")
-            self.conn.execute(
-                f"SET s3_access_key_id='{self.storage_options['AWS_ACCESS_KEY_ID']}'"
-            )
-            secret_key = self.storage_options["AWS_SECRET_ACCESS_KEY"]
-            self.conn.execute(f"SET s3_secret_access_key='{secret_key}'")
-            self.conn.execute(f"SET s3_endpoint='{self.endpoint}'")
-            self.conn.execute("SET s3_use_ssl=false")
-            self.conn.execute("SET s3_url_style='path'")
-
-            # Prepare file paths
-            file_paths = []
-            for file in files:
-                file_paths.append(f"{delta_path}/{file}")
-
-            # Create table from first file
-            create_query = f"""
-                CREATE OR REPLACE TABLE "{table_name}" AS
-                SELECT * FROM parquet_scan('{file_paths[0]}')
+            self.conn.execute("LOAD httpfs")
+        except duckdb.IOException:
+            self.conn.execute("INSTALL httpfs; LOAD httpfs")
+
+        # CREATE SECRET takes no prepared parameters, so quote the values
+        options = self.storage_options
+        self.conn.execute(
+            f"""
+            CREATE OR REPLACE SECRET {quote_identifier(f"minilake_{self.bucket}")} (
+                TYPE S3,
+                KEY_ID {quote_literal(options["AWS_ACCESS_KEY_ID"])},
+                SECRET {quote_literal(options["AWS_SECRET_ACCESS_KEY"])},
+                REGION {quote_literal(options["AWS_REGION"])},
+                ENDPOINT {quote_literal(self.endpoint)},
+                URL_STYLE 'path',
+                USE_SSL false,
+                SCOPE {quote_literal(f"s3://{self.bucket}")}
+            );
+            SET enable_http_metadata_cache=true;
+            SET enable_object_cache=true;
+            SET http_retries=5;
             """
-            self.conn.execute(create_query)
-
-            # Add data from other files
-            if len(file_paths) > 1:
-                for file_path in file_paths[1:]:
-                    insert_query = f"""
-                        INSERT INTO "{table_name}"
-                        SELECT * FROM parquet_scan('{file_path}')
-                    """
-                    self.conn.execute(insert_query)
-
-        except Exception as e:
-            raise StorageError(f"Error loading Delta files into DuckDB: {e!s}") from e
+        )
+        self._s3_configured = True
+
+    def _prepare_scan(self, delta_path: str) -> None:
+        """Configure httpfs before the first scan of an S3 table."""
+        if delta_path.startswith("s3://"):
+            self._configure_s3()
@@ -1,11 +1,14 @@
 """Unit tests for API endpoints."""
 
+import datetime
+import time
 
 import duckdb
 import pyarrow as pa
 import pytest
 from fastapi.testclient import TestClient
 
+from minilake.api.endpoint import retriever
 from minilake.api.endpoint.retriever import app
 from minilake.storage.s3 import S3Manager
 
@@ -58,7 +61,7 @@ def setup_test_table():
     schema = pa.schema([("id", pa.int32()), ("value", pa.string())])
 
     s3.create_table(table_name="test_table", delta_path="test_table", schema=schema)
-    yield
+    yield s3
 
 
 def test_retrieve_endpoint(client):
@@ -85,6 +88,19 @@ def test_retrieve_endpoint_with_version(client):
     assert response.json() == {"message": "Data retrieved successfully"}
 
 
+def test_retrieve_endpoint_with_columns(client):
+    """Test the retrieve endpoint with a column projection."""
+    response = client.get(
+        "/retrieve",
+        params={
+            "delta_path": "test_table",
+            "table_name": "test_columns",
+            "columns": ["id", "value"],
+        },
+    )
+    assert response.status_code == 200
+
+
 def test_retrieve_endpoint_with_invalid_timestamp(client):
     """Test the retrieve endpoint with invalid timestamp parameter."""
     response = client.get(
@@ -96,3 +112,25 @@ def test_retrieve_endpoint_with_invalid_timestamp(client):
         },
     )
     assert response.status_code == 422  # Validation error
+
+
+def test_retrieve_endpoint_with_timestamp(client, setup_test_table):
+    """Test the retrieve endpoint returns the snapshot at the timestamp."""
+    time.sleep(0.01)
+    timestamp = datetime.datetime.now(datetime.UTC).isoformat()
+    time.sleep(0.01)
+    s3 = setup_test_table
+    s3.conn.execute("INSERT INTO test_table VALUES (3, 'test3')")
+    s3.create_table(table_name="test_table", delta_path="test_table")
+
+    response = client.get(
+        "/retrieve",
+        params={
+            "delta_path": "test_table",
+            "table_name": "test_snapshot",
+            "timestamp": timestamp,
+        },
+    )
+    assert response.status_code == 200
+    count = retriever.conn.execute("SELECT COUNT(*) FROM test_snapshot").fetchone()
+    assert count[0] == 2
@@ -3,11 +3,18 @@ import os
 import time
 
 import boto3
+import duckdb
 import pytest
 from botocore.client import Config
 from dotenv import load_dotenv
 
 
+@pytest.fixture
+def conn():
+    """Create an in-memory DuckDB connection."""
+    return duckdb.connect(":memory:")
+
+
 @pytest.fixture(scope="session")
 def minio_server():
     """Setup MinIO test environment using existing Docker Compose service."""
@@ -0,0 +1,176 @@
+"""Unit tests for DuckDB connection management."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from minilake.core.connection import DBConnection, MinilakeConnection, get_minilake
+
+
+@pytest.fixture
+def db(mocker):
+    """Create a fresh DBConnection with a pool of two siblings."""
+    mocker.patch.object(DBConnection, "_instance", None)
+    mocker.patch.object(DBConnection, "_init_extensions")
+    mocker.patch("minilake.core.connection.os.cpu_count", return_value=8)
+    return DBConnection._get_instance(":memory:", pool_size=2)
+
+
+def test_init_extensions_skips_loaded(mocker):
+    """Verify extensions that are already loaded are not installed again."""
+    db = DBConnection.__new__(DBConnection)
+    db.conn = mocker.Mock(wraps=duckdb.connect(":memory:"))
+    mocker.patch.object(DBConnection, "EXTENSIONS", ("parquet", "json"))
+
+    db._init_extensions()
+
+    assert db.conn.execute.call_count == 1
+
+
+def test_init_extensions_batches_statements(mocker):
+    """Verify pending extensions are installed and loaded in one call."""
+    db = DBConnection.__new__(DBConnection)
+    db.conn = mocker.Mock()
+    db.conn.execute.return_value.fetchall.return_value = [
+        ("httpfs", False),
+        ("json", True),
+    ]
+
+    db._init_extensions()
+
+    db.conn.execute.assert_called_with("INSTALL httpfs; LOAD httpfs; LOAD json")
+    assert db.conn.execute.call_count == 2
+
+
+def test_init_extensions_skips_missing_optional(mocker):
+    """Verify optional extensions are only loaded when already installed."""
+    db = DBConnection.__new__(DBConnection)
+    db.conn = mocker.Mock()
+    db.conn.execute.return_value.fetchall.return_value = [
+        ("httpfs", True),
+        ("cache_httpfs", False),
+    ]
+
+    db._init_extensions()
+
+    db.conn.execute.assert_called_with("LOAD httpfs")
+
+
+def test_init_extensions_tolerates_offline_install(mocker):
+    """Verify a failed download does not prevent loading other extensions."""
+    db = DBConnection.__new__(DBConnection)
+    db.conn = mocker.Mock()
+    db.conn.execute.return_value.fetchall.return_value = [
+        ("httpfs", False),
+        ("json", True),
+    ]
+
+    def execute(sql, *args):
+        if sql.startswith("INSTALL"):
+            raise duckdb.IOException("Failed to download extension")
+        return mocker.DEFAULT
+
+    db.conn.execute.side_effect = execute
+
+    db._init_extensions()
+
+    db.conn.execute.assert_called_with("LOAD json")
+
+
+def test_acquire_shares_database(db):
+    """Verify pooled connections see tables created on the root connection."""
+    db.conn.execute("CREATE TABLE t AS SELECT 1 AS id")
+    assert db._pool.qsize() == 0
+
+    with DBConnection.acquire() as first, DBConnection.acquire() as second:
+        assert first is not second
+        assert first.execute("SELECT id FROM t").fetchall() == [(1,)]
+
+    assert db._pool.qsize() == 2
+
+
+def test_acquire_reuses_idle_connection(db):
+    """Verify an idle sibling is reused instead of opening another one."""
+    with DBConnection.acquire() as first:
+        pass
+    with DBConnection.acquire() as second:
+        assert second is first
+
+    assert db._opened == 1
+
+
+def test_acquire_returns_connection_on_error(db):
+    """Verify a connection is returned to the pool when the block raises."""
+    with pytest.raises(duckdb.Error), DBConnection.acquire() as conn:
+        conn.execute("SELECT * FROM missing")
+
+    assert db._pool.qsize() == 1
+
+
+def test_pooled_connections_run_concurrently(db):
+    """Verify statements run on pooled connections from several threads."""
+    db.conn.execute("CREATE TABLE t (id INTEGER)")
+
+    def work(i: int) -> int:
+        with DBConnection.acquire() as conn:
+            conn.execute("INSERT INTO t VALUES (?)", [i])
+            view = f"v_{i}"
+            conn.execute(f"CREATE VIEW {view} AS SELECT * FROM t WHERE id = {i}")
+            try:
+                return conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()[0]
+            finally:
+                conn.execute(f"DROP VIEW {view}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        counts = list(pool.map(work, range(64)))
+
+    assert counts == [1] * 64
+    assert db.conn.execute("SELECT COUNT(*) FROM t").fetchone() == (64,)
+    assert db._opened <= 2
+
+
+def test_get_connection_skips_lock_once_created(db, mocker):
+    """Verify the initialized connection is returned without taking the lock."""
+    lock = mocker.patch.object(DBConnection, "_lock")
+
+    assert DBConnection.get_connection() is db.conn
+    lock.__enter__.assert_not_called()
+
+
+@pytest.fixture
+def minio_env(monkeypatch):
+    """Provide MinIO settings without contacting a server."""
+    monkeypatch.setenv("MINIO_ROOT_USER", "test-user")
+    monkeypatch.setenv("MINIO_ROOT_PASSWORD", "test-password")
+    monkeypatch.setenv("MINIO_DEFAULT_BUCKETS", "test-bucket")
+    monkeypatch.setattr("botocore.client.BaseClient._make_api_call", lambda *args: {})
+
+
+def test_s3_client_is_reused(minio_env):
+    """Verify MinilakeConnection instances share one client per credential set."""
+    first, second = MinilakeConnection(), MinilakeConnection()
+
+    assert first.s3_client is second.s3_client
+
+
+def test_list_s3_folders_paginates(minio_env, mocker):
+    """Verify folders are collected across pages without duplicates."""
+    connection = MinilakeConnection()
+    paginator = mocker.patch.object(connection.s3_client, "get_paginator")
+    paginator.return_value.paginate.return_value = [
+        {"CommonPrefixes": [{"Prefix": "sales/"}, {"Prefix": "hr/"}]},
+        {"CommonPrefixes": [{"Prefix": "sales/"}]},
+        {},
+    ]
+
+    assert connection.list_s3_folders() == ["hr", "sales"]
+
+
+def test_get_minilake_validates_once(minio_env, mocker):
+    """Verify the shared connection is created and validated only once."""
+    mocker.patch("minilake.core.connection._minilake", None)
+    validate = mocker.patch.object(MinilakeConnection, "validate")
+
+    assert get_minilake() is get_minilake()
+    validate.assert_called_once()
@@ -0,0 +1,93 @@
+"""Unit tests for MinilakeCore."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pyarrow import fs
+
+from minilake.core import MinilakeCore
+
+
+@pytest.fixture
+def s3_client(mocker):
+    """Patch the shared MinIO connection with a mocked S3 client."""
+    connection = mocker.patch("minilake.core.get_minilake").return_value
+    connection.bucket = "test-bucket"
+    return connection.s3_client
+
+
+@pytest.fixture
+def core(s3_client):
+    """Create a MinilakeCore with a mocked MinIO connection."""
+    core = MinilakeCore()
+    yield core
+    core.invalidate()
+
+
+def test_list_tables_paginates(core, s3_client):
+    """Verify tables are collected across pages and sorted."""
+    s3_client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "sales/orders.parquet"}, {"Key": "sales/notes.txt"}]},
+        {"Contents": [{"Key": "sales/customers.parquet"}]},
+    ]
+
+    tables = core.list_tables("sales")
+
+    assert tables == ["customers", "orders"]
+    s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+
+
+def test_list_tables_keeps_parquet_in_name(core, s3_client):
+    """Verify only the file extension is stripped from table names."""
+    s3_client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "raw/my.parquet.backup.parquet"}]},
+    ]
+
+    assert core.list_tables("raw") == ["my.parquet.backup"]
+
+
+def test_list_tables_empty_folder(core, s3_client):
+    """Verify the placeholder is returned when a folder has no tables."""
+    s3_client.get_paginator.return_value.paginate.return_value = [{}]
+
+    assert core.list_tables("empty") == ["No tables found"]
+
+
+def test_list_tables_is_cached(core, s3_client):
+    """Verify repeated listings are served from cache until invalidated."""
+    paginate = s3_client.get_paginator.return_value.paginate
+    paginate.return_value = [{"Contents": [{"Key": "sales/orders.parquet"}]}]
+
+    assert core.list_tables("sales") == ["orders"]
+    assert core.list_tables("sales") == ["orders"]
+    assert paginate.call_count == 1
+
+    core.invalidate("sales")
+    core.list_tables("sales")
+    assert paginate.call_count == 2
+
+
+def test_table_cache_is_shared(core, s3_client):
+    """Verify a new MinilakeCore reuses the listings cached by another."""
+    paginate = s3_client.get_paginator.return_value.paginate
+    paginate.return_value = [{"Contents": [{"Key": "sales/orders.parquet"}]}]
+
+    assert core.list_tables("sales") == ["orders"]
+    assert MinilakeCore().list_tables("sales") == ["orders"]
+    assert paginate.call_count == 1
+
+
+def test_get_table_preview_reads_first_rows(core, mocker, tmp_path):
+    """Verify the preview only returns the first ten rows of the table."""
+    (tmp_path / "sales").mkdir()
+    pq.write_table(
+        pa.table({"id": list(range(100))}),
+        tmp_path / "sales" / "orders.parquet",
+        row_group_size=25,
+    )
+    core.connection.bucket = str(tmp_path)
+    mocker.patch("minilake.core.fs.S3FileSystem", return_value=fs.LocalFileSystem())
+
+    preview = core.get_table_preview("sales", "orders")
+
+    assert preview["id"].tolist() == list(range(10))
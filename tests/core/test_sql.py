@@ -0,0 +1,33 @@
+"""Tests for SQL text helpers."""
+
+import duckdb
+
+from minilake.core.sql import quote_identifier, quote_literal, quote_paths
+
+
+def test_quote_identifier():
+    """Verify embedded double quotes are escaped."""
+    assert quote_identifier("orders") == '"orders"'
+    assert quote_identifier('my "odd" table') == '"my ""odd"" table"'
+
+
+def test_quote_literal():
+    """Verify embedded single quotes are escaped."""
+    assert quote_literal("o'clock") == "'o''clock'"
+
+
+def test_quote_paths():
+    """Verify a path becomes a string literal and a list a list literal."""
+    assert quote_paths("data/a.parquet") == "'data/a.parquet'"
+    assert quote_paths(["a.parquet", "b's.parquet"]) == "['a.parquet', 'b''s.parquet']"
+
+
+def test_quoted_identifier_round_trips():
+    """Verify a quoted name creates exactly the table with that name."""
+    conn = duckdb.connect(":memory:")
+    name = 'a"; DROP TABLE x; --'
+
+    conn.execute(f"CREATE TABLE {quote_identifier(name)} AS SELECT 1 AS id")
+
+    tables = conn.execute("SELECT table_name FROM information_schema.tables")
+    assert tables.fetchall() == [(name,)]
@@ -0,0 +1,66 @@
+"""Tests for CSV ingestion strategy."""
+
+import pytest
+
+from minilake.core.exceptions import IngestionError
+from minilake.ingestion.csv import CsvIngestion
+
+
+@pytest.fixture
+def csv_files(tmp_path):
+    """Write two small CSV files sharing the same layout."""
+    first = tmp_path / "first.csv"
+    first.write_text("id,name\n1,alice\n2,bob\n")
+    second = tmp_path / "second.csv"
+    second.write_text("id,name\n3,carol\n")
+    return [first, second]
+
+
+def test_ingest_auto_detect(conn, csv_files):
+    """Verify a single CSV file is ingested with an auto-detected schema."""
+    CsvIngestion().ingest(conn, csv_files[0], "people")
+
+    result = conn.execute("SELECT * FROM people ORDER BY id").fetchall()
+    assert result == [(1, "alice"), (2, "bob")]
+
+
+def test_ingest_with_schema(conn, csv_files):
+    """Verify an explicit schema is applied to the created table."""
+    schema = {"id": "BIGINT", "name": "VARCHAR"}
+    CsvIngestion().ingest(conn, csv_files[0], "people", schema=schema)
+
+    types = conn.execute(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_name = 'people' ORDER BY ordinal_position"
+    ).fetchall()
+    assert types == [("BIGINT",), ("VARCHAR",)]
+    assert conn.execute("SELECT COUNT(*) FROM people").fetchone()[0] == 2
+
+
+def test_ingest_file_list(conn, csv_files):
+    """Verify a list of files is ingested in a single scan."""
+    CsvIngestion().ingest(conn, csv_files, "people")
+
+    result = conn.execute("SELECT id FROM people ORDER BY id").fetchall()
+    assert result == [(1,), (2,), (3,)]
+
+
+def test_ingest_missing_file(conn, tmp_path):
+    """Verify ingestion errors are wrapped in IngestionError."""
+    with pytest.raises(IngestionError) as excinfo:
+        CsvIngestion().ingest(conn, tmp_path / "missing.csv", "people")
+    assert "Error ingesting CSV file" in str(excinfo.value)
+
+
+def test_ingest_with_schema_failure_leaves_no_table(conn, tmp_path):
+    """Verify a failed typed load does not leave an empty table behind."""
+    path = tmp_path / "bad.csv"
+    path.write_text("id,name\nnot-a-number,alice\n")
+
+    with pytest.raises(IngestionError):
+        CsvIngestion().ingest(
+            conn, path, "people", schema={"id": "BIGINT", "name": "VARCHAR"}
+        )
+
+    tables = conn.execute("SELECT table_name FROM information_schema.tables")
+    assert tables.fetchall() == []
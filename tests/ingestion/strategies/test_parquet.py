@@ -0,0 +1,52 @@
+"""Tests for Parquet ingestion strategy."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from minilake.ingestion.parquet import ParquetIngestion
+
+
+@pytest.fixture
+def parquet_files(tmp_path):
+    """Write two Parquet files sharing the same schema."""
+    paths = []
+    for part, ids in enumerate([[1, 2], [3]]):
+        path = tmp_path / f"part-{part}.parquet"
+        pq.write_table(pa.table({"id": ids}), path)
+        paths.append(path)
+    return paths
+
+
+def test_ingest_single_file(conn, parquet_files):
+    """Verify a single Parquet file is ingested."""
+    ParquetIngestion().ingest(conn, parquet_files[0], "ids")
+
+    result = conn.execute("SELECT id FROM ids ORDER BY id").fetchall()
+    assert result == [(1,), (2,)]
+
+
+def test_ingest_file_list(conn, parquet_files):
+    """Verify a list of files is ingested in a single scan."""
+    ParquetIngestion().ingest(conn, parquet_files, "ids")
+
+    result = conn.execute("SELECT id FROM ids ORDER BY id").fetchall()
+    assert result == [(1,), (2,), (3,)]
+
+
+def test_ingest_glob(conn, parquet_files, tmp_path):
+    """Verify a glob pattern is forwarded to DuckDB."""
+    ParquetIngestion().ingest(conn, tmp_path / "*.parquet", "ids")
+
+    assert conn.execute("SELECT COUNT(*) FROM ids").fetchone()[0] == 3
+
+
+def test_ingest_as_view(conn, parquet_files):
+    """Verify materialize=False creates a view over the files."""
+    ParquetIngestion().ingest(conn, parquet_files, "ids", materialize=False)
+
+    table_type = conn.execute(
+        "SELECT table_type FROM information_schema.tables WHERE table_name = 'ids'"
+    ).fetchone()[0]
+    assert table_type == "VIEW"
+    assert conn.execute("SELECT COUNT(*) FROM ids").fetchone()[0] == 3
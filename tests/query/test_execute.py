@@ -0,0 +1,154 @@
+"""Tests for SQL query execution."""
+
+import datetime
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from minilake.core.connection import DBConnection
+from minilake.core.exceptions import QueryError
+from minilake.query.execute import QueryExecutor
+from minilake.storage.local import LocalDeltaStorage
+
+
+@pytest.fixture
+def executor(mocker, tmp_path):
+    """Create a QueryExecutor on an in-memory connection and local storage."""
+    conn = duckdb.connect(":memory:")
+    mocker.patch(
+        "minilake.storage.factory.create_storage",
+        return_value=LocalDeltaStorage(conn, delta_root=str(tmp_path)),
+    )
+    conn.execute("CREATE TABLE letters AS SELECT * FROM (VALUES (1, 'a')) t(id, name)")
+    return QueryExecutor(conn)
+
+
+@pytest.fixture
+def pooled_executor(mocker, tmp_path):
+    """Create a QueryExecutor on a fresh connection pool and local storage."""
+    mocker.patch.object(DBConnection, "_instance", None)
+    mocker.patch.object(DBConnection, "_init_extensions")
+    conn = DBConnection.get_connection(":memory:", pool_size=4)
+    mocker.patch(
+        "minilake.storage.factory.create_storage",
+        return_value=LocalDeltaStorage(conn, delta_root=str(tmp_path)),
+    )
+    conn.execute("CREATE TABLE letters AS SELECT * FROM (VALUES (1, 'a')) t(id, name)")
+    return QueryExecutor()
+
+
+@pytest.mark.parametrize(
+    ("output_format", "result_type"),
+    [("pandas", pd.DataFrame), ("polars", pl.DataFrame), ("arrow", pa.Table)],
+)
+def test_execute_query_formats(executor, output_format, result_type):
+    """Verify results are returned in the requested format."""
+    result = executor.execute_query("SELECT * FROM letters", output_format)
+
+    assert isinstance(result, result_type)
+    assert result.shape == (1, 2)
+
+
+def test_execute_query_unsupported_format(executor):
+    """Verify unsupported output formats raise QueryError."""
+    with pytest.raises(QueryError):
+        executor.execute_query("SELECT * FROM letters", "csv")
+
+
+def test_query_delta_table(executor):
+    """Verify Delta tables are queried through a view that is dropped after."""
+    executor.storage.create_table("letters", "letters")
+
+    result = executor.query_delta_table(
+        "letters", "SELECT name FROM delta_table WHERE id = 1", temp_table="tmp"
+    )
+
+    assert result["name"].tolist() == ["a"]
+    tables = executor.conn.execute("SELECT table_name FROM information_schema.tables")
+    assert tables.fetchall() == [("letters",)]
+
+
+def test_query_delta_table_rewrites_any_reference(executor):
+    """Verify delta_table is replaced regardless of case, spacing or CTEs."""
+    executor.storage.create_table("letters", "letters")
+
+    result = executor.query_delta_table(
+        "letters",
+        "WITH t AS (SELECT * from\n  DELTA_TABLE) SELECT COUNT(*) AS n FROM t",
+        temp_table="tmp",
+    )
+
+    assert result["n"].tolist() == [1]
+
+
+def test_query_delta_table_naive_timestamp(executor):
+    """Verify a timestamp string without an offset is read as UTC."""
+    executor.storage.create_table("letters", "letters")
+    time.sleep(0.01)
+    now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+    time.sleep(0.01)
+    executor.conn.execute("INSERT INTO letters VALUES (2, 'b')")
+    executor.storage.create_table("letters", "letters")
+
+    result = executor.query_delta_table(
+        "letters",
+        "SELECT COUNT(*) AS n FROM delta_table",
+        timestamp=now.isoformat(sep=" "),
+    )
+
+    assert result["n"].tolist() == [1]
+
+
+def test_query_delta_table_concurrently(pooled_executor):
+    """Verify concurrent calls on one pooled executor do not share a view."""
+    pooled_executor.storage.create_table("letters", "letters")
+
+    def query(_: int) -> list[str]:
+        result = pooled_executor.query_delta_table(
+            "letters", "SELECT name FROM delta_table"
+        )
+        return result["name"].tolist()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(query, range(64)))
+
+    assert results == [["a"]] * 64
+    views = pooled_executor.conn.execute("SELECT view_name FROM duckdb_views()")
+    assert [name for (name,) in views.fetchall() if name.startswith("temp_")] == []
+
+
+def test_query_delta_table_read_only(mocker, tmp_path):
+    """Verify Delta tables can be queried on a read-only database."""
+    database = str(tmp_path / "minilake.db")
+    with duckdb.connect(database) as conn:
+        conn.execute("CREATE TABLE letters AS SELECT 1 AS id, 'a' AS name")
+    mocker.patch.object(DBConnection, "_instance", None)
+    mocker.patch.object(DBConnection, "_init_extensions")
+    conn = DBConnection.get_connection(database, read_only=True)
+    storage = LocalDeltaStorage(conn, delta_root=str(tmp_path / "delta"))
+    storage.create_table("letters", "letters")
+    mocker.patch("minilake.storage.factory.create_storage", return_value=storage)
+
+    result = QueryExecutor().query_delta_table("letters", "SELECT * FROM delta_table")
+
+    assert result["name"].tolist() == ["a"]
+
+
+def test_import_does_not_load_dataframe_libraries():
+    """Verify importing the executor loads neither pandas, Polars nor deltalake."""
+    code = (
+        "import sys, minilake.query.execute; "
+        "print([m for m in ('pandas', 'polars', 'deltalake') if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
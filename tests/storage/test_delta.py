@@ -1,12 +1,14 @@
 """Tests for Delta storage implementation."""
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import duckdb
 import pyarrow as pa
 import pytest
-from deltalake import DeltaTable
+from deltalake import DeltaTable, write_deltalake
 from dotenv import load_dotenv
 
 from minilake.core.exceptions import StorageError
@@ -66,6 +68,21 @@ def test_init(config, delta_storage):
     assert delta_storage.s3_client is not None
 
 
+def test_s3_client_is_shared(config, delta_storage):
+    """Verify storages with the same credentials reuse one S3 client."""
+    other = S3Manager(
+        conn=duckdb.connect(":memory:"),
+        endpoint=config.minio_endpoint,
+        access_key=config.minio_access_key,
+        secret_key=config.minio_secret_key,
+        bucket=config.minio_bucket,
+    )
+
+    assert "s3_client" not in vars(other)
+    assert other.s3_client is delta_storage.s3_client
+    assert other.s3_client.meta.config.max_pool_connections == 64
+
+
 def test_create_table_basic(delta_storage, cleanup_tables):
     """Verify basic Delta table creation with simple schema and data."""
     conn = delta_storage.conn
@@ -95,10 +112,77 @@ def test_create_table_basic(delta_storage, cleanup_tables):
     assert result[1][1] == "test2"
 
     info = delta_storage.get_table_info("test_table_basic")
-    assert "version" in info
-    assert "metadata" in info
-    assert "files" in info
-    assert len(info["files"]) > 0
+    assert info.version >= 0
+    assert info.metadata is not None
+    assert len(info.files) > 0
+    assert info.history[0]["operation"] == "WRITE"
+
+
+def test_create_table_binds_source_name(delta_storage, cleanup_tables):
+    """Verify source table names are bound rather than spliced into SQL."""
+    conn = delta_storage.conn
+    conn.execute('CREATE TABLE "odd ""name""" AS SELECT 1 AS id')
+
+    delta_storage.create_table(table_name='odd "name"', delta_path="test_table_odd")
+    delta_storage.read_to_duckdb(delta_path="test_table_odd", table_name="test_table")
+
+    assert conn.execute("SELECT id FROM test_table").fetchall() == [(1,)]
+
+
+def test_create_table_uses_zstd(delta_storage, cleanup_tables):
+    """Verify Delta data files are written with ZSTD compression."""
+    conn = delta_storage.conn
+    conn.execute("CREATE TABLE test_table AS SELECT * FROM range(10) t(id)")
+
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_zstd")
+
+    _path = Path(delta_storage._get_delta_path("test_table_zstd"))
+    files = [
+        str(_path / f) for f in delta_storage.get_table_info("test_table_zstd").files
+    ]
+    codecs = conn.execute(
+        "SELECT DISTINCT compression FROM parquet_metadata(?)", [files]
+    ).fetchall()
+    assert codecs == [("ZSTD",)]
+
+
+def test_create_table_row_groups(delta_storage, cleanup_tables):
+    """Verify Delta data files are split into bounded row groups."""
+    conn = delta_storage.conn
+    conn.execute("CREATE TABLE test_table AS SELECT * FROM range(250000) t(id)")
+
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_rg")
+
+    _path = Path(delta_storage._get_delta_path("test_table_rg"))
+    info = delta_storage.get_table_info("test_table_rg")
+    files = [str(_path / f) for f in info.files]
+    row_groups = conn.execute(
+        "SELECT COUNT(DISTINCT row_group_id) FROM parquet_metadata(?)", [files]
+    ).fetchone()[0]
+    assert row_groups == 3
+
+
+def test_create_table_sorted(delta_storage, cleanup_tables):
+    """Verify sorted writes produce non-overlapping row group statistics."""
+    conn = delta_storage.conn
+    conn.execute(
+        "CREATE TABLE test_table AS SELECT (range * 7919) % 250000 AS id "
+        "FROM range(250000)"
+    )
+
+    delta_storage.create_table(
+        table_name="test_table", delta_path="test_table_sorted", sort_by=["id"]
+    )
+
+    _path = Path(delta_storage._get_delta_path("test_table_sorted"))
+    info = delta_storage.get_table_info("test_table_sorted")
+    files = [str(_path / f) for f in info.files]
+    bounds = conn.execute(
+        "SELECT stats_min_value::BIGINT, stats_max_value::BIGINT "
+        "FROM parquet_metadata(?) ORDER BY row_group_id",
+        [files],
+    ).fetchall()
+    assert bounds == [(0, 99999), (100000, 199999), (200000, 249999)]
 
 
 def test_create_table_with_schema(delta_storage, cleanup_tables):
@@ -137,12 +221,13 @@ def test_create_table_with_schema(delta_storage, cleanup_tables):
     )
 
     info = delta_storage.get_table_info("test_table_schema")
-    assert len(info["files"]) > 0
+    assert len(info.files) > 0
 
-    delta_schema = info["schema"]
-    assert len(delta_schema["fields"]) == 4
+    delta_schema = info.schema
+    assert isinstance(delta_schema, pa.Schema)
+    assert len(delta_schema) == 4
 
-    field_names = [field["name"] for field in delta_schema["fields"]]
+    field_names = delta_schema.names
     assert "id" in field_names
     assert "name" in field_names
     assert "age" in field_names
@@ -248,6 +333,96 @@ def test_read_to_duckdb(delta_storage, cleanup_tables):
     assert result[1][1] == "test2"
 
 
+def test_read_to_duckdb_columns(delta_storage, cleanup_tables):
+    """Verify only the requested columns are loaded into DuckDB."""
+    conn = delta_storage.conn
+
+    conn.execute("CREATE TABLE test_table AS SELECT 1 AS id, 'test1' AS value")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_columns")
+
+    delta_storage.read_to_duckdb(
+        delta_path="test_table_columns",
+        table_name="test_table_read",
+        columns=["value"],
+    )
+
+    result = conn.execute("SELECT * FROM test_table_read").fetchall()
+    assert result == [("test1",)]
+
+
+def test_read_to_duckdb_as_view(delta_storage, cleanup_tables):
+    """Verify materialize=False exposes the Delta table as a view."""
+    conn = delta_storage.conn
+
+    conn.execute("CREATE TABLE test_table AS SELECT * FROM range(3) t(id)")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_view")
+
+    delta_storage.read_to_duckdb(
+        delta_path="test_table_view", table_name="test_view", materialize=False
+    )
+
+    table_type = conn.execute(
+        "SELECT table_type FROM information_schema.tables "
+        "WHERE table_name = 'test_view'"
+    ).fetchone()[0]
+    assert table_type == "VIEW"
+    assert conn.execute("SELECT SUM(id) FROM test_view").fetchone()[0] == 3
+
+
+def test_read_to_duckdb_on_connection(delta_storage, cleanup_tables):
+    """Verify a given connection gets a view that only it can see."""
+    conn = delta_storage.conn
+    conn.execute("CREATE TABLE test_table AS SELECT * FROM range(3) t(id)")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_temp")
+    other = conn.cursor()
+
+    delta_storage.read_to_duckdb(
+        "test_table_temp", "test_view", materialize=False, conn=other
+    )
+
+    assert other.execute("SELECT COUNT(*) FROM test_view").fetchone() == (3,)
+    with pytest.raises(duckdb.CatalogException):
+        conn.execute("SELECT * FROM test_view")
+
+
+def test_delta_table_is_cached(delta_storage, cleanup_tables):
+    """Verify DeltaTable handles are reused and refreshed after writes."""
+    conn = delta_storage.conn
+    conn.execute("CREATE TABLE test_table AS SELECT 1 AS id")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_cache")
+
+    dt = delta_storage._get_delta_table("test_table_cache")
+    version = dt.version()
+
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_cache")
+
+    assert delta_storage._get_delta_table("test_table_cache") is dt
+    assert delta_storage.get_table_info("test_table_cache").version == version + 1
+    previous = delta_storage._get_delta_table("test_table_cache", version=version)
+    assert previous.version() == version
+
+
+def test_delta_table_loads_run_in_parallel(delta_storage, mocker):
+    """Verify a slow table load does not block loading another table."""
+    started, release = threading.Event(), threading.Event()
+
+    def load(path, **kwargs):
+        if path.endswith("slow"):
+            started.set()
+            release.wait(5)
+        return mocker.Mock()
+
+    mocker.patch("minilake.storage.delta.DeltaTable", side_effect=load)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        slow = pool.submit(delta_storage._get_delta_table, "slow")
+        assert started.wait(5)
+        fast = delta_storage._get_delta_table("fast")
+        assert not slow.done()
+        release.set()
+        assert slow.result() is not fast
+
+
 def test_error_handling(delta_storage):
     """Verify proper error handling for non-existent resources."""
     with pytest.raises(StorageError) as excinfo:
@@ -259,3 +434,250 @@ def test_error_handling(delta_storage):
     with pytest.raises(StorageError) as excinfo:
         delta_storage.get_table_info("nonexistent_table")
     assert "Error getting table info" in str(excinfo.value)
+
+
+def test_configure_s3_once(delta_storage, mocker):
+    """Verify the DuckDB S3 settings are applied only on first use."""
+    delta_storage.conn = mocker.Mock()
+
+    delta_storage._configure_s3()
+    delta_storage._configure_s3()
+
+    assert delta_storage.conn.execute.call_count == 2
+
+
+def test_load_delta_files_from_s3(delta_storage, mocker):
+    """Verify S3 tables configure httpfs and scan URIs joined with slashes."""
+    configure = mocker.patch.object(delta_storage, "_configure_s3")
+    scan = mocker.patch.object(delta_storage, "_scan_files")
+
+    delta_storage._load_delta_files(
+        ["part-0.parquet"], "s3://test-bucket/tables/t/", "test_table"
+    )
+
+    configure.assert_called_once_with()
+    scan.assert_called_once_with(
+        "test_table", ["s3://test-bucket/tables/t/part-0.parquet"], None, True, None
+    )
+
+
+def test_read_with_partition_filters(delta_storage, cleanup_tables):
+    """Verify partition filters skip the files of other partitions."""
+    conn = delta_storage.conn
+    conn.execute(
+        "CREATE TABLE test_table AS SELECT range AS id, range % 3 AS g FROM range(9)"
+    )
+    delta_storage.create_table(
+        table_name="test_table", delta_path="test_table_pruned", partition_by=["g"]
+    )
+
+    delta_storage.read_to_duckdb(
+        delta_path="test_table_pruned",
+        table_name="test_table_read",
+        partition_filters=[("g", "=", "1")],
+    )
+
+    result = conn.execute("SELECT id, g FROM test_table_read ORDER BY id").fetchall()
+    assert result == [(1, 1), (4, 1), (7, 1)]
+
+
+def test_table_info_history_limit(delta_storage, cleanup_tables):
+    """Verify the history is read lazily and capped by history_limit."""
+    conn = delta_storage.conn
+    conn.execute("CREATE TABLE test_table AS SELECT 1 AS id")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_hist")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_hist")
+
+    info = delta_storage.get_table_info("test_table_hist", history_limit=1)
+
+    assert "history" not in vars(info)
+    assert len(info.history) == 1
+    assert info.history[0]["version"] == info.version
+
+
+@pytest.mark.parametrize("zorder_by", [None, ["id"]])
+def test_optimize(delta_storage, mocker, zorder_by):
+    """Verify optimize either compacts or z-orders, towards large files."""
+    dt = mocker.patch.object(delta_storage, "_get_delta_table").return_value
+
+    delta_storage.optimize("test_table_opt", zorder_by=zorder_by)
+
+    if zorder_by:
+        dt.optimize.compact.assert_not_called()
+        call = dt.optimize.z_order.call_args
+        assert call.args == (["id"],)
+    else:
+        call = dt.optimize.compact.call_args
+    assert call.kwargs["target_size"] == 256 << 20
+    assert call.kwargs["writer_properties"].compression == "ZSTD(3)"
+
+
+@pytest.mark.parametrize("materialize", [True, False])
+def test_read_after_schema_evolution(delta_storage, cleanup_tables, materialize):
+    """Verify files written before a column was added read it as NULL."""
+    _path = str(delta_storage._get_delta_path("test_table_evolved"))
+    write_deltalake(
+        _path, pa.table({"id": [1]}), mode="overwrite", schema_mode="overwrite"
+    )
+    write_deltalake(
+        _path,
+        pa.table({"id": [2], "name": ["b"]}),
+        mode="append",
+        schema_mode="merge",
+    )
+
+    delta_storage.read_to_duckdb(
+        delta_path="test_table_evolved",
+        table_name="test_table_read",
+        materialize=materialize,
+    )
+
+    result = delta_storage.conn.execute(
+        "SELECT id, name FROM test_table_read ORDER BY id"
+    ).fetchall()
+    assert result == [(1, None), (2, "b")]
+
+
+def test_configure_s3_creates_secret(config, mocker):
+    """Verify credentials are registered as a quoted, bucket-scoped secret."""
+    storage = S3Manager(
+        conn=mocker.Mock(),
+        endpoint=config.minio_endpoint,
+        access_key="key",
+        secret_key="se'cret",
+        bucket="test-bucket",
+    )
+
+    storage._configure_s3()
+
+    sql = storage.conn.execute.call_args.args[0]
+    statements = [
+        " ".join(statement.query.split()).rstrip(";")
+        for statement in duckdb.connect().extract_statements(sql)
+    ]
+    assert statements == [
+        'CREATE OR REPLACE SECRET "minilake_test-bucket" ( TYPE S3, '
+        "KEY_ID 'key', SECRET 'se''cret', REGION 'eu-east-1', "
+        f"ENDPOINT '{config.minio_endpoint}', URL_STYLE 'path', USE_SSL false, "
+        "SCOPE 's3://test-bucket' )",
+        "SET enable_http_metadata_cache=true",
+        "SET enable_object_cache=true",
+        "SET http_retries=5",
+    ]
+
+
+def test_configure_s3_applies_settings(config):
+    """Verify the generated statements run on a real DuckDB connection."""
+    conn = duckdb.connect(":memory:")
+    storage = S3Manager(
+        conn=conn,
+        endpoint=config.minio_endpoint,
+        access_key="key",
+        secret_key="secret",
+        bucket="test-bucket",
+    )
+    try:
+        conn.execute("LOAD httpfs")
+    except duckdb.IOException:
+        pytest.skip("httpfs extension is not installed")
+
+    storage._configure_s3()
+
+    secrets = conn.execute("SELECT name, scope FROM duckdb_secrets()").fetchall()
+    assert secrets == [("minilake_test-bucket", ["s3://test-bucket"])]
+    assert conn.execute("SELECT current_setting('http_retries')").fetchone() == (5,)
+
+
+def test_configure_s3_installs_httpfs_when_missing(delta_storage, mocker):
+    """Verify httpfs is only installed when loading it fails."""
+    delta_storage.conn = mocker.Mock()
+    delta_storage.conn.execute.side_effect = [duckdb.IOException, None, None]
+
+    delta_storage._configure_s3()
+
+    statements = [c.args[0] for c in delta_storage.conn.execute.call_args_list]
+    assert statements[:2] == ["LOAD httpfs", "INSTALL httpfs; LOAD httpfs"]
+
+
+def test_file_listing_is_cached(delta_storage, cleanup_tables, mocker):
+    """Verify a version's file list is computed once for info and reads."""
+    conn = delta_storage.conn
+    conn.execute("CREATE TABLE test_table AS SELECT 1 AS id")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_files")
+    files = mocker.spy(DeltaTable, "files")
+
+    info = delta_storage.get_table_info("test_table_files")
+    assert len(info.files) == 1
+    delta_storage.read_to_duckdb("test_table_files", "test_table_read")
+
+    assert files.call_count == 1
+
+
+def test_maintain_runs_every_table(delta_storage, mocker):
+    """Verify each table is optimized then vacuumed, and failures are reported."""
+
+    def fail_on_b(delta_path, retention):
+        if delta_path == "b":
+            raise StorageError("boom")
+
+    optimize = mocker.patch.object(delta_storage, "optimize")
+    vacuum = mocker.patch.object(delta_storage, "vacuum", side_effect=fail_on_b)
+
+    with pytest.raises(StorageError, match="b: boom"):
+        delta_storage.maintain(["a", "b", "c"], retention=200)
+
+    assert sorted(c.args for c in optimize.call_args_list) == [
+        ("a", None),
+        ("b", None),
+        ("c", None),
+    ]
+    assert sorted(c.args for c in vacuum.call_args_list) == [
+        ("a", 200),
+        ("b", 200),
+        ("c", 200),
+    ]
+
+
+def test_vacuum_deletes_files(delta_storage, mocker):
+    """Verify vacuum deletes files, keeping at least seven days of history."""
+    dt = mocker.patch.object(delta_storage, "_get_delta_table").return_value
+
+    delta_storage.vacuum("test_table", retention=24)
+
+    dt.vacuum.assert_called_once_with(retention_hours=168, dry_run=False)
+
+
+def test_table_info_stays_at_its_version(delta_storage, cleanup_tables):
+    """Verify lazy files and history describe the version the info was taken at."""
+    conn = delta_storage.conn
+    conn.execute("CREATE TABLE test_table AS SELECT 1 AS id")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_pin")
+    info = delta_storage.get_table_info("test_table_pin", history_limit=2)
+    files = delta_storage._get_delta_table("test_table_pin").files()
+
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_pin")
+    delta_storage.read_to_duckdb("test_table_pin", "test_table_read")
+
+    assert delta_storage.get_table_info("test_table_pin").version == info.version + 1
+    assert info.files == files
+    assert [commit["version"] for commit in info.history] == [
+        info.version,
+        info.version - 1,
+    ][: info.version + 1]
+
+
+def test_table_info_keeps_dict_access(delta_storage, cleanup_tables):
+    """Verify the keys of the former info dict can still be read as items."""
+    conn = delta_storage.conn
+    conn.execute("CREATE TABLE test_table AS SELECT 1 AS id, 'a' AS name")
+    delta_storage.create_table(table_name="test_table", delta_path="test_table_dict")
+
+    info = delta_storage.get_table_info("test_table_dict")
+
+    assert list(info.keys()) == ["version", "metadata", "files", "history", "schema"]
+    assert info["version"] == info.version
+    assert info["files"] == info.files
+    assert info["history"] == info.history
+    assert [f["name"] for f in info["schema"]["fields"]] == ["id", "name"]
+    assert info.get("missing") is None
+